@@ -0,0 +1,535 @@
+"""
+A small, fast checker for the two violations shown in strict_checker.py:
+
+- private-usage: reaching into `obj._attr` from outside the object
+  (`service._user_repository`); `self._x`, `cls._x`, `super()._x` and any
+  `other._x` inside the class that defines `_x` are fine.
+- incompatible-override: a method whose signature does not match the one it
+  overrides (`B.get(self, b: int) -> int` over `A.get(self, name: str) -> str`).
+
+    python ast_checker.py [paths ...] [--json] [--workers N] [--cache FILE]
+
+Files are parsed in a process pool into plain summaries, which are cached by
+content hash together with each file's diagnostics. On the next run only
+changed files are re-parsed, and only they and the modules that (transitively)
+import them are re-checked.
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+CACHE_VERSION = 3
+Summary = dict[str, Any]
+Diagnostic = dict[str, Any]
+
+
+# =========== Parsing (runs in worker processes) ===========
+
+
+def _dotted(node: ast.expr) -> str | None:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute) and (base := _dotted(node.value)):
+        return f"{base}.{node.attr}"
+    if isinstance(node, ast.Subscript):  # Generic[T], HTTPException[Problem]
+        return _dotted(node.value)
+    return None
+
+
+def _is_private(name: str) -> bool:
+    return name.startswith("_") and not (name.startswith("__") and name.endswith("__"))
+
+
+def _unparse(node: ast.expr | None) -> str | None:
+    return ast.unparse(node) if node is not None else None
+
+
+def _signature(func: ast.FunctionDef | ast.AsyncFunctionDef) -> dict[str, Any]:
+    args = func.args
+    positional = args.posonlyargs + args.args
+    defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+    return {
+        "params": [
+            [a.arg, _unparse(a.annotation), d is not None] for a, d in zip(positional, defaults)
+        ],
+        "kwonly": [
+            [a.arg, _unparse(a.annotation), d is not None]
+            for a, d in zip(args.kwonlyargs, args.kw_defaults)
+        ],
+        "varargs": args.vararg is not None,
+        "varkw": args.kwarg is not None,
+        "static": any(_dotted(d) == "staticmethod" for d in func.decorator_list),
+        "returns": _unparse(func.returns),
+        "line": func.lineno,
+        "col": func.col_offset,
+    }
+
+
+def _class_members(node: ast.ClassDef) -> set[str]:
+    "Names a class defines: methods, class attributes and anything set on `self`/`cls`."
+    members: set[str] = set()
+    for item in node.body:
+        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            members.add(item.name)
+        elif isinstance(item, (ast.Assign, ast.AnnAssign)):
+            targets = item.targets if isinstance(item, ast.Assign) else [item.target]
+            members.update(t.id for t in targets if isinstance(t, ast.Name))
+    for sub in ast.walk(node):
+        if (
+            isinstance(sub, ast.Attribute)
+            and isinstance(sub.ctx, ast.Store)
+            and isinstance(sub.value, ast.Name)
+            and sub.value.id in ("self", "cls")
+        ):
+            members.add(sub.attr)
+    return members
+
+
+class _PrivateUsageVisitor(ast.NodeVisitor):
+    def __init__(self) -> None:
+        self.found: list[Diagnostic] = []
+        self.enclosing: list[set[str]] = []  # members of each class being visited
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self.enclosing.append(_class_members(node))
+        self.generic_visit(node)
+        self.enclosing.pop()
+
+    def visit_Attribute(self, node: ast.Attribute) -> None:
+        value = node.value
+        owner_access = (isinstance(value, ast.Name) and value.id in ("self", "cls")) or (
+            isinstance(value, ast.Call) and _dotted(value.func) == "super"
+        )
+        # `other._x` inside the class that defines `_x` is fine too (__eq__, factories)
+        owner_access = owner_access or any(node.attr in members for members in self.enclosing)
+        if _is_private(node.attr) and not owner_access:
+            self.found.append(
+                {
+                    "line": node.lineno,
+                    "col": node.col_offset,
+                    "code": "private-usage",
+                    "message": f'"{node.attr}" is private and used outside of its class',
+                }
+            )
+        self.generic_visit(node)
+
+
+def summarize(path: str, source: bytes, module: str) -> Summary:
+    """
+    Everything the checks need from one file, as JSON-serializable data.
+    """
+    tree = ast.parse(source, filename=path)
+    # relative imports resolve against the package, which a package's __init__ is itself
+    package = [] if module == "__init__" else module.split(".")
+    if Path(path).stem != "__init__":
+        package = package[:-1]
+    imports: dict[str, str] = {}  # local name -> qualified name
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports[alias.asname or alias.name.split(".")[0]] = (
+                    alias.name if alias.asname else alias.name.split(".")[0]
+                )
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                pkg = package[: max(len(package) - node.level + 1, 0)]
+                base = ".".join(p for p in (*pkg, base) if p)
+            for alias in node.names:
+                imports[alias.asname or alias.name] = f"{base}.{alias.name}"
+
+    classes: dict[str, Any] = {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            classes[node.name] = {
+                "bases": [b for b in map(_dotted, node.bases) if b],
+                "methods": {
+                    item.name: _signature(item)
+                    for item in node.body
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                },
+            }
+
+    visitor = _PrivateUsageVisitor()
+    visitor.visit(tree)
+    return {"module": module, "imports": imports, "classes": classes, "private": visitor.found}
+
+
+def _summarize_job(job: tuple[str, str]) -> tuple[str, Summary | None, str | None]:
+    path, module = job
+    try:
+        return path, summarize(path, Path(path).read_bytes(), module), None
+    except SyntaxError as exc:
+        return path, None, f"{exc.msg} (line {exc.lineno})"
+
+
+# =========== Class hierarchy ===========
+
+
+_TOP_TYPES = {"Any", "typing.Any", "object"}
+# builtins whose relations are known without an index: each maps to what it may stand in for
+_PROMOTIONS = {
+    "None": {"None"},
+    "bool": {"bool", "int", "float", "complex"},
+    "int": {"int", "float", "complex"},
+    "float": {"float", "complex"},
+    "complex": {"complex"},
+    "str": {"str"},
+    "bytes": {"bytes"},
+}
+
+
+def _qualify(module: Summary, name: str) -> str:
+    head, _, rest = name.partition(".")
+    if head in module["imports"]:
+        return ".".join(p for p in (module["imports"][head], rest) if p)
+    if head in module["classes"]:
+        return f"{module['module']}.{name}"
+    return name
+
+
+class ClassIndex:
+    "Cross-module index of every class, keyed by qualified name."
+
+    def __init__(self, summaries: dict[str, Summary]):
+        self.classes: dict[str, dict[str, Any]] = {}
+        self.modules: dict[str, Summary] = {}
+        for summary in summaries.values():
+            self.modules[summary["module"]] = summary
+            for name, cls in summary["classes"].items():
+                self.classes[f"{summary['module']}.{name}"] = cls
+
+    def resolve(self, module: Summary, name: str) -> str | None:
+        head, _, rest = name.partition(".")
+        if head in module["classes"] and not rest:
+            qualified = f"{module['module']}.{head}"
+        elif head in module["imports"]:
+            qualified = ".".join(p for p in (module["imports"][head], rest) if p)
+        else:
+            return None
+        return qualified if qualified in self.classes else None
+
+    def is_subtype(self, sub_module: Summary, sub: str, sup_module: Summary, sup: str) -> bool | None:
+        "Whether type `sub` may stand in for `sup`, or None if that cannot be told from here."
+        if sup in _TOP_TYPES or sub in ("Any", "typing.Any"):
+            return True
+        sub_cls, sup_cls = self.resolve(sub_module, sub), self.resolve(sup_module, sup)
+        if sub_cls and sup_cls:
+            return sub_cls == sup_cls or sup_cls in self.ancestors(sub_cls)
+        if sub in _PROMOTIONS and sup in _PROMOTIONS and not (sub_cls or sup_cls):
+            return sup in _PROMOTIONS[sub]
+        if _qualify(sub_module, sub) == _qualify(sup_module, sup):
+            return True
+        return None
+
+    def ancestors(self, qualified: str) -> Iterator[str]:
+        "Base classes in a depth-first, left-to-right order (an MRO approximation)."
+        module = self.modules[qualified.rsplit(".", 1)[0]]
+        seen: set[str] = set()
+        stack = [(module, b) for b in reversed(self.classes[qualified]["bases"])]
+        while stack:
+            mod, base = stack.pop()
+            if (resolved := self.resolve(mod, base)) is None or resolved in seen:
+                continue
+            seen.add(resolved)
+            yield resolved
+            owner = self.modules[resolved.rsplit(".", 1)[0]]
+            stack.extend((owner, b) for b in reversed(self.classes[resolved]["bases"]))
+
+
+def _union_members(annotation: str) -> list[str] | None:
+    """
+    Names in a plain, `Optional[...]`, `Union[...]` or `X | Y` annotation.
+
+    None for anything else (generics, literals, callables), which the
+    checker does not try to compare.
+    """
+    try:
+        stack = [ast.parse(annotation, mode="eval").body]
+    except SyntaxError:
+        return None
+    members: list[str] = []
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):  # "Forward" reference
+            try:
+                stack.append(ast.parse(node.value, mode="eval").body)
+            except SyntaxError:
+                return None
+        elif isinstance(node, ast.Constant) and node.value is None:
+            members.append("None")
+        elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+            stack += (node.left, node.right)
+        elif isinstance(node, ast.Subscript):
+            origin = _dotted(node.value)
+            if origin in ("Optional", "typing.Optional"):
+                members.append("None")
+                stack.append(node.slice)
+            elif origin in ("Union", "typing.Union"):
+                elts = node.slice.elts if isinstance(node.slice, ast.Tuple) else [node.slice]
+                stack += elts
+            else:
+                return None
+        elif name := _dotted(node):
+            members.append(name)
+        else:
+            return None
+    return members
+
+
+def _assignable(
+    index: ClassIndex, sub_module: Summary, sub: str, sup_module: Summary, sup: str
+) -> bool | None:
+    "Whether annotation `sub` is assignable to `sup`; None when it cannot be decided."
+    if sub == sup:
+        return True
+    subs, sups = _union_members(sub), _union_members(sup)
+    if subs is None or sups is None:
+        return None
+    verdict: bool | None = True
+    for member in subs:
+        results = {index.is_subtype(sub_module, member, sup_module, t) for t in sups}
+        if True not in results:
+            if None not in results:
+                return False
+            verdict = None
+    return verdict
+
+
+def _compatible(
+    child: dict[str, Any],
+    parent: dict[str, Any],
+    index: ClassIndex,
+    child_module: Summary,
+    parent_module: Summary,
+) -> str | None:
+    """
+    Why `child` cannot override `parent`, or None if it can.
+
+    Parameters may widen and return types may narrow; types the checker
+    cannot relate to each other are not reported.
+    """
+    # drop self/cls, static methods have neither
+    c_params = child["params"][0 if child["static"] else 1 :]
+    p_params = parent["params"][0 if parent["static"] else 1 :]
+    for i, (p_name, p_type, _) in enumerate(p_params):
+        if i >= len(c_params):
+            if not child["varargs"]:
+                return f'missing parameter "{p_name}"'
+            continue
+        c_name, c_type, _ = c_params[i]
+        if c_name != p_name:
+            return f'parameter {i + 1} name mismatch: base "{p_name}", override "{c_name}"'
+        if p_type and c_type and _assignable(index, parent_module, p_type, child_module, c_type) is False:
+            return f'parameter "{p_name}" type mismatch: base "{p_type}", override "{c_type}"'
+    p_kwonly = {name for name, _, _ in parent["kwonly"]}
+    for c_name, _, has_default in c_params[len(p_params) :]:
+        if not has_default and c_name not in p_kwonly:
+            return f'extra parameter "{c_name}" has no default'
+
+    # keyword-only parameters may also be taken positionally or through **kwargs
+    c_named = {name: c_type for name, c_type, _ in c_params + child["kwonly"]}
+    for p_name, p_type, _ in parent["kwonly"]:
+        if p_name not in c_named:
+            if not child["varkw"]:
+                return f'missing keyword parameter "{p_name}"'
+            continue
+        c_type = c_named[p_name]
+        if p_type and c_type and _assignable(index, parent_module, p_type, child_module, c_type) is False:
+            return f'parameter "{p_name}" type mismatch: base "{p_type}", override "{c_type}"'
+    for c_name, _, has_default in child["kwonly"]:
+        if not has_default and c_name not in p_kwonly:
+            return f'extra keyword parameter "{c_name}" has no default'
+    if parent["varargs"] and not child["varargs"]:
+        return 'missing "*args"'
+    if parent["varkw"] and not child["varkw"]:
+        return 'missing "**kwargs"'
+    c_ret, p_ret = child["returns"], parent["returns"]
+    if p_ret and c_ret and _assignable(index, child_module, c_ret, parent_module, p_ret) is False:
+        return f'return type mismatch: base "{parent["returns"]}", override "{child["returns"]}"'
+    return None
+
+
+def check_module(summary: Summary, index: ClassIndex) -> list[Diagnostic]:
+    diagnostics = list(summary["private"])
+    for name, cls in summary["classes"].items():
+        ancestors = list(index.ancestors(f"{summary['module']}.{name}"))
+        for method, sig in cls["methods"].items():
+            if method.startswith("__") and method.endswith("__"):
+                continue
+            for base in ancestors:
+                if (parent := index.classes[base]["methods"].get(method)) is None:
+                    continue
+                parent_module = index.modules[base.rsplit(".", 1)[0]]
+                if reason := _compatible(sig, parent, index, summary, parent_module):
+                    diagnostics.append(
+                        {
+                            "line": sig["line"],
+                            "col": sig["col"],
+                            "code": "incompatible-override",
+                            "message": f'"{name}.{method}" overrides "{base}.{method}" '
+                            f"incompatibly: {reason}",
+                        }
+                    )
+                break
+    return sorted(diagnostics, key=lambda d: (d["line"], d["col"]))
+
+
+# =========== Driver ===========
+
+
+def iter_python_files(paths: Iterable[Path]) -> Iterator[Path]:
+    for path in paths:
+        if path.is_dir():
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames[:] = [d for d in dirnames if not d.startswith((".", "__pycache__"))]
+                yield from (Path(dirpath) / f for f in sorted(filenames) if f.endswith(".py"))
+        elif path.suffix == ".py":
+            yield path
+
+
+def module_name(path: Path, root: Path) -> str:
+    parts = path.resolve().relative_to(root).with_suffix("").parts
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts) or "__init__"
+
+
+def _dependencies(summary: Summary, modules: set[str]) -> set[str]:
+    deps: set[str] = set()
+    for target in summary["imports"].values():
+        while target and target not in modules:
+            target = target.rpartition(".")[0]
+        if target:
+            deps.add(target)
+    return deps
+
+
+def run(
+    paths: Iterable[Path],
+    root: Path,
+    cache_file: Path,
+    workers: int | None = None,
+) -> tuple[dict[str, list[Diagnostic]], dict[str, int]]:
+    cache: dict[str, Any]
+    try:
+        cache = json.loads(cache_file.read_text())
+        if cache.get("version") != CACHE_VERSION:
+            raise ValueError
+    except (FileNotFoundError, ValueError):
+        cache = {"version": CACHE_VERSION, "files": {}}
+    old_files: dict[str, Any] = cache["files"]
+
+    hashes: dict[str, str] = {}
+    modules: dict[str, str] = {}
+    for path in iter_python_files(paths):
+        key = str(path)
+        hashes[key] = hashlib.sha256(path.read_bytes()).hexdigest()
+        modules[key] = module_name(path, root)
+
+    changed = [k for k, h in hashes.items() if old_files.get(k, {}).get("sha256") != h]
+    unchanged = hashes.keys() - set(changed)
+    summaries: dict[str, Summary] = {
+        k: old_files[k]["summary"] for k in unchanged if old_files[k]["summary"] is not None
+    }
+    # files that failed to parse last time and did not change still fail, with the same error
+    errors: dict[str, str] = {
+        k: old_files[k]["diagnostics"][0]["message"]
+        for k in unchanged
+        if old_files[k]["summary"] is None
+    }
+    if changed:
+        jobs = [(k, modules[k]) for k in changed]
+        if len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_summarize_job, jobs, chunksize=16))
+        else:
+            results = [_summarize_job(jobs[0])]
+        for key, summary, error in results:
+            if summary is not None:
+                summaries[key] = summary
+            else:
+                errors[key] = error or "syntax error"
+
+    # a file must be re-checked if it, or anything it transitively imports, changed
+    by_module = {s["module"]: k for k, s in summaries.items()}
+    deps = {k: {by_module[m] for m in _dependencies(s, set(by_module))} for k, s in summaries.items()}
+    dirty = set(changed) | (old_files.keys() - hashes.keys())
+    stale = {k for k in summaries if k in dirty or k not in old_files}
+    grew = True
+    while grew:
+        grew = False
+        for key, key_deps in deps.items():
+            if key not in stale and (key_deps & stale or any(d in dirty for d in key_deps)):
+                stale.add(key)
+                grew = True
+    for key in summaries:  # a removed module may have been a dependency
+        if key not in stale and set(old_files[key].get("deps", [])) - set(deps[key]):
+            stale.add(key)
+
+    index = ClassIndex(summaries)
+    diagnostics: dict[str, list[Diagnostic]] = {}
+    new_files: dict[str, Any] = {}
+    for key in hashes:
+        if key in errors:
+            diagnostics[key] = [
+                {"line": 0, "col": 0, "code": "syntax-error", "message": errors[key]}
+            ]
+            new_files[key] = {"sha256": hashes[key], "summary": None, "deps": [], "diagnostics": diagnostics[key]}
+            continue
+        if key in stale:
+            found = check_module(summaries[key], index)
+        else:
+            found = old_files[key]["diagnostics"]
+        diagnostics[key] = found
+        new_files[key] = {
+            "sha256": hashes[key],
+            "summary": summaries[key],
+            "deps": sorted(deps[key]),
+            "diagnostics": found,
+        }
+
+    tmp = cache_file.with_name(cache_file.name + ".tmp")
+    tmp.write_text(json.dumps({"version": CACHE_VERSION, "files": new_files}))
+    os.replace(tmp, cache_file)
+    stats = {
+        "files": len(hashes),
+        "parsed": len(changed),
+        "checked": len(stale) + len(errors.keys() - unchanged),
+    }
+    return diagnostics, stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check private usage and override signatures")
+    parser.add_argument("paths", nargs="*", type=Path, default=[Path(".")])
+    parser.add_argument("--root", type=Path, default=Path("."), help="Import root for module names")
+    parser.add_argument("--cache", type=Path, default=Path(".ast_checker_cache.json"))
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    diagnostics, stats = run(args.paths, args.root.resolve(), args.cache, args.workers)
+    total = sum(map(len, diagnostics.values()))
+    if args.json:
+        print(json.dumps({"success": total == 0, **stats, "diagnostics": diagnostics}))
+    else:
+        for path, found in diagnostics.items():
+            for d in found:
+                print(f"{path}:{d['line']}:{d['col'] + 1}: {d['code']}: {d['message']}")
+        print(
+            f"{total} problems in {stats['files']} files "
+            f"({stats['parsed']} parsed, {stats['checked']} checked)"
+        )
+    sys.exit(1 if total else 0)
+
+
+if __name__ == "__main__":
+    main()
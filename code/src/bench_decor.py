@@ -0,0 +1,103 @@
+"""
+Per-call overhead of `check_result` compared to an undecorated function.
+
+    python bench_decor.py
+"""
+
+import asyncio
+import timeit
+from functools import partial
+from typing import Any, Awaitable, Callable, ParamSpec, TypeVar
+
+from decor import check_result, check_results, is_even, larger_than, meets_conditions, np
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+CONDITIONS = (is_even, partial(larger_than, threshold=5))
+CALLS = 1_000_000
+
+
+def legacy_check_result(
+    *conditions: Callable[[T], bool],
+) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    "The original wrapper: repacks `conditions` and builds a generator per call."
+
+    def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            result = func(*args, **kwargs)
+            if not meets_conditions(*conditions, target=result):
+                raise ValueError("Return value did not meet required conditions")
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+VARIANTS: dict[str, Callable[[int, int], int]] = {
+    "undecorated": add,
+    "legacy": legacy_check_result(*CONDITIONS)(add),
+    "bound": check_result(*CONDITIONS)(add),
+    "every=100": check_result(*CONDITIONS, every=100)(add),
+    "interval=1ms": check_result(*CONDITIONS, interval=0.001)(add),
+}
+
+
+def bench_sync() -> None:
+    base = None
+    for label, func in VARIANTS.items():
+        seconds = min(timeit.repeat(lambda: func(3, 5), number=CALLS, repeat=5))
+        per_call = seconds / CALLS * 1e9
+        base = base or per_call
+        print(f"{label:<14} {per_call:7.1f} ns/call  overhead {per_call - base:6.1f} ns")
+
+
+def bench_async() -> None:
+    async def async_add(a: int, b: int) -> int:
+        return a + b
+
+    checked = check_result(*CONDITIONS)(async_add)
+
+    async def run(func: Callable[[int, int], Awaitable[int]], n: int) -> None:
+        for _ in range(n):
+            await func(3, 5)
+
+    n = CALLS // 10
+    for label, func in (("async plain", async_add), ("async checked", checked)):
+        seconds = timeit.timeit(lambda: asyncio.run(run(func, n)), number=1)
+        print(f"{label:<14} {seconds / n * 1e9:7.1f} ns/call")
+
+
+def bench_batch() -> None:
+    values = list(range(6, 200_006, 2))
+
+    def identity(x: int) -> int:
+        return x
+
+    def identity_all(xs: Any) -> Any:
+        return xs
+
+    per_item = check_result(*CONDITIONS)(identity)
+    batched = check_results(*CONDITIONS)(identity_all)
+
+    loop = timeit.timeit(lambda: [per_item(v) for v in values], number=5) / 5
+    print(f"{'per item':<14} {loop * 1e3:7.2f} ms / {len(values)} values")
+    seq = timeit.timeit(lambda: batched(values), number=5) / 5
+    print(f"{'batch list':<14} {seq * 1e3:7.2f} ms / {len(values)} values")
+    if np is not None:
+        arr = np.array(values)
+        vec = timeit.timeit(lambda: batched(arr), number=5) / 5
+        print(f"{'batch ndarray':<14} {vec * 1e3:7.2f} ms / {len(values)} values")
+    else:
+        print("batch ndarray  skipped, numpy is not installed")
+
+
+if __name__ == "__main__":
+    bench_sync()
+    bench_async()
+    bench_batch()
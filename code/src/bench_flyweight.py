@@ -0,0 +1,107 @@
+"""
+Memory and throughput of the flyweight `User` against the original dict cache.
+
+    python bench_flyweight.py
+"""
+
+import gc
+import random
+import timeit
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, ClassVar
+
+from flyweihgt import FlyweightCache, Policy, User
+
+
+class DictUser:
+    "The original implementation: unbounded dict, `__init__` rerun on every hit."
+
+    _users: ClassVar[dict[tuple[str, int], "DictUser"]] = {}
+
+    def __new__(cls, name: str, age: int) -> "DictUser":
+        if not (u := cls._users.get((name, age))):
+            cls._users[(name, age)] = u = super().__new__(cls)
+        return u
+
+    def __init__(self, name: str, age: int):
+        self.name = name
+        self.age = age
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._users.clear()
+
+
+DISTINCT_KEYS = 200_000
+CALLS = 500_000
+
+
+def workload(seed: int = 0) -> list[tuple[str, int]]:
+    # skewed: most calls hit a small set of hot users, the tail keeps growing
+    rng = random.Random(seed)
+    hot = [(f"user{i}", i % 90) for i in range(1_000)]
+    return [
+        rng.choice(hot) if rng.random() < 0.8 else (f"user{rng.randrange(DISTINCT_KEYS)}", rng.randrange(90))
+        for _ in range(CALLS)
+    ]
+
+
+UserCache = FlyweightCache[tuple[str, int], User]
+
+
+def use_policy(
+    policy: Policy | None, maxsize: int = 10_000
+) -> tuple[Callable[[str, int], object], UserCache | None]:
+    if policy is None:
+        DictUser.reset()
+        return DictUser, None
+    return User, User.configure(policy, maxsize)
+
+
+def measure(label: str, policy: Policy | None, keys: list[tuple[str, int]]) -> None:
+    make, _ = use_policy(policy)
+    gc.collect()
+    tracemalloc.start()
+    for name, age in keys:
+        make(name, age)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    make, cache = use_policy(policy)
+    seconds = timeit.timeit(lambda: [make(n, a) for n, a in keys], number=1)
+
+    line = f"{label:<8} {len(keys) / seconds / 1e6:6.2f} M calls/s  peak {peak / 2**20:7.1f} MiB"
+    if (c := cache) is not None:
+        line += f"  hits={c.hits} misses={c.misses} evictions={c.evictions} size={len(c)}"
+    print(line)
+
+
+def measure_threads(policy: Policy, keys: list[tuple[str, int]], threads: int = 8) -> None:
+    # large enough that nothing is evicted, so every key must map to exactly one instance
+    use_policy(policy, maxsize=len(set(keys)))
+    chunks = [keys[i::threads] for i in range(threads)]
+
+    def run(chunk: list[tuple[str, int]]) -> list[User]:
+        return [User(n, a) for n, a in chunk]
+
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(pool.map(run, chunks))
+    seen: dict[tuple[str, int], User] = {}
+    for chunk in results:
+        for u in chunk:
+            first = seen.setdefault((u.name, u.age), u)
+            assert u is first, f"two instances for {(u.name, u.age)}"
+    print(f"{policy:<8} {threads} threads ok, {len(seen)} keys map to one instance each")
+
+
+def main() -> None:
+    keys = workload()
+    measure("dict", None, keys)
+    measure("lru", "lru", keys)
+    measure("weak", "weak", keys)
+    measure_threads("lru", keys)
+
+
+if __name__ == "__main__":
+    main()
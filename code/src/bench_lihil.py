@@ -0,0 +1,226 @@
+"""
+In-process ASGI benchmark for the lihil example app in test.py.
+
+    python bench_lihil.py [--requests 20000] [--concurrency 1]
+
+Written against lihil 0.2.41 (`problems=` on route decorators, `Lihil.include`).
+
+Requests are fed straight into `lhl` through the ASGI interface, no sockets
+involved. Three scenarios are reported as requests/sec and p50/p99 latency:
+
+- hello: the happy path, `GET /` from test.py
+- problem: `POST /orders` raising `InvalidOrderError`, rendered by lihil,
+  which pays for `__post_init__` message formatting and `asdict()` on every
+  request
+- problem (cached): the same error answered from a memoized, pre-serialized
+  problem payload registered with `problem_solver`
+
+It also times the pieces of the error path on their own, including
+`__json_example__` with and without memoization.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import timeit
+from contextlib import asynccontextmanager
+from functools import cache
+from pathlib import Path
+from time import perf_counter, perf_counter_ns
+from typing import Any, AsyncGenerator, Callable, Coroutine
+
+from lihil import Route
+from lihil.problems import problem_solver
+from starlette.requests import Request
+from starlette.responses import Response
+
+# test.py would be shadowed by the stdlib `test` package, load it by path
+_spec = importlib.util.spec_from_file_location("lihil_example", Path(__file__).with_name("test.py"))
+assert _spec and _spec.loader
+example = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(example)
+
+AddressOutOfScopeProblem = example.AddressOutOfScopeProblem
+InvalidOrderError = example.InvalidOrderError
+lhl = example.lhl
+
+ASGIApp = Callable[..., Coroutine[Any, Any, None]]
+
+
+orders = Route("orders")
+
+
+@orders.post(problems=[InvalidOrderError])
+async def create_order() -> None:
+    raise InvalidOrderError(
+        AddressOutOfScopeProblem(current_address="home", service_radius=3.5, distance=4)
+    )
+
+
+lhl.include(orders)
+
+
+# =========== Memoized error path ===========
+
+
+@cache
+def cached_json_example() -> dict[str, Any]:
+    return InvalidOrderError.__json_example__()
+
+
+@cache
+def cached_problem_body(instance: str) -> bytes:
+    "The problem detail for `create_order` never varies, serialize it once per path."
+    detail = AddressOutOfScopeProblem(current_address="home", service_radius=3.5, distance=4)
+    return json.dumps(
+        {
+            "type_": "invalid-order-error",
+            "title": InvalidOrderError.__doc__,
+            "status": 422,
+            "detail": detail.asdict(),
+            "instance": instance,
+        }
+    ).encode()
+
+
+def enable_cached_problems() -> None:
+    @problem_solver
+    def solve_invalid_order(req: Request, exc: InvalidOrderError) -> Response:
+        return Response(
+            cached_problem_body(req.url.path),
+            status_code=422,
+            media_type="application/problem+json",
+        )
+
+
+# =========== ASGI driver ===========
+
+
+@asynccontextmanager
+async def lifespan(app: ASGIApp) -> AsyncGenerator[None, None]:
+    events: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    started, stopped = asyncio.Event(), asyncio.Event()
+
+    async def send(message: dict[str, Any]) -> None:
+        kind = message["type"]
+        if kind.endswith("failed"):
+            raise RuntimeError(message.get("message", kind))
+        (started if kind == "lifespan.startup.complete" else stopped).set()
+
+    task = asyncio.create_task(
+        app({"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}, events.get, send)
+    )
+    await events.put({"type": "lifespan.startup"})
+    await started.wait()
+    try:
+        yield
+    finally:
+        await events.put({"type": "lifespan.shutdown"})
+        await stopped.wait()
+        await task
+
+
+async def request(app: ASGIApp, method: str, path: str) -> tuple[int, bytes]:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+        "state": {},
+    }
+    received = False
+    status = 0
+    body: list[bytes] = []
+
+    async def receive() -> dict[str, Any]:
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, b"".join(body)
+
+
+async def load(
+    app: ASGIApp, method: str, path: str, expect: int, n: int, concurrency: int
+) -> dict[str, float]:
+    latencies: list[int] = []
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            start = perf_counter_ns()
+            status, body = await request(app, method, path)
+            latencies.append(perf_counter_ns() - start)
+            if status != expect:
+                raise RuntimeError(f"{method} {path}: expected {expect}, got {status}: {body!r}")
+
+    for _ in range(min(n, 200)):  # warm up
+        await request(app, method, path)
+    start = perf_counter()
+    await asyncio.gather(*(worker(n // concurrency) for _ in range(concurrency)))
+    elapsed = perf_counter() - start
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_us": latencies[len(latencies) // 2] / 1e3,
+        "p99_us": latencies[int(len(latencies) * 0.99)] / 1e3,
+    }
+
+
+def report(label: str, stats: dict[str, float]) -> None:
+    print(
+        f"{label:<18} {stats['rps']:10.0f} req/s  "
+        f"p50 {stats['p50_us']:8.1f} us  p99 {stats['p99_us']:8.1f} us"
+    )
+
+
+def bench_components(number: int = 100_000) -> None:
+    def timed(label: str, func: Callable[[], object]) -> None:
+        per_call = min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+        print(f"{label:<26} {per_call:8.2f} us")
+
+    detail = AddressOutOfScopeProblem(current_address="home", service_radius=3.5, distance=4)
+    timed("detail + __post_init__", lambda: AddressOutOfScopeProblem("home", 3.5, 4))
+    timed("detail.asdict()", detail.asdict)
+    timed("__json_example__", InvalidOrderError.__json_example__)
+    timed("__json_example__ (cached)", cached_json_example)
+    timed("problem body (cached)", lambda: cached_problem_body("/orders"))
+
+
+async def main(n: int, concurrency: int) -> None:
+    async with lifespan(lhl):
+        report("hello", await load(lhl, "GET", "/", 200, n, concurrency))
+        report("problem", await load(lhl, "POST", "/orders", 422, n, concurrency))
+        _, rendered = await request(lhl, "POST", "/orders")
+        enable_cached_problems()
+        _, cached = await request(lhl, "POST", "/orders")
+        assert json.loads(cached) == json.loads(rendered), (cached, rendered)
+        report("problem (cached)", await load(lhl, "POST", "/orders", 422, n, concurrency))
+    bench_components()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="In-process lihil ASGI benchmark")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -1,5 +1,24 @@
-from functools import partial
-from typing import Callable, ParamSpec, TypeVar
+from functools import partial, wraps
+from importlib import import_module
+from inspect import iscoroutinefunction
+from time import monotonic
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    ParamSpec,
+    Sequence,
+    TypeVar,
+    cast,
+    overload,
+)
+
+# numpy is optional and untyped here, batch checks fall back to a plain loop
+try:
+    np: Any = import_module("numpy")
+except ImportError:
+    np = None
 
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -19,13 +38,146 @@ def meets_conditions(*conditions: Callable[[T], bool], target: T) -> bool:
     return all(condition(target) for condition in conditions)
 
 
-def check_result(*conditions: Callable[[T], bool]):
-    def decorator(func: Callable[P, T]):
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            result = func(*args, **kwargs)
-            if not meets_conditions(*conditions, target=result):
-                raise ValueError("Return value did not meet required conditions")
-            return result
+def _bind_conditions(conditions: tuple[Callable[[T], bool], ...]) -> Callable[[T], bool]:
+    "Build the check once, at decoration time, instead of on every call."
+    if len(conditions) == 1:
+        return conditions[0]
+
+    def check(target: T) -> bool:
+        for condition in conditions:
+            if not condition(target):
+                return False
+        return True
+
+    return check
+
+
+def _sampler(every: int, interval: float | None) -> Callable[[], bool] | None:
+    """
+    Decide whether the current call gets validated.
+
+    `every=N` validates one call in N; `interval=s` validates at most once
+    every `s` seconds. Given both, a call is validated only when it is the
+    Nth call and `s` seconds have passed since the last validation.
+    Returns None when every call should be validated.
+    """
+    if every <= 1 and interval is None:
+        return None
+
+    calls = 0
+    next_check = 0.0
+
+    def should_check() -> bool:
+        nonlocal calls, next_check
+        calls += 1
+        if calls < every:
+            return False
+        calls = 0
+        if interval is not None:
+            now = monotonic()
+            if now < next_check:
+                return False
+            next_check = now + interval
+        return True
+
+    return should_check
+
+
+def check_result(
+    *conditions: Callable[[T], bool],
+    every: int = 1,
+    interval: float | None = None,
+):
+    """
+    Validate the return value of the decorated function against `conditions`.
+
+    Works on coroutine functions too, checking the awaited result. With
+    `every`/`interval` only sampled calls are validated (see `_sampler`);
+    each decorated function keeps its own sampling state.
+    """
+    check = _bind_conditions(conditions)
+
+    def fail() -> None:
+        raise ValueError("Return value did not meet required conditions")
+
+    @overload
+    def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]: ...
+
+    @overload
+    def decorator(func: Callable[P, T]) -> Callable[P, T]: ...
+
+    def decorator(func: Callable[P, Any]) -> Callable[P, Any]:
+        should_check = _sampler(every, interval)
+
+        if iscoroutinefunction(func):
+            async_func = cast(Callable[P, Awaitable[T]], func)
+
+            @wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                result = await async_func(*args, **kwargs)
+                if (should_check is None or should_check()) and not check(result):
+                    fail()
+                return result
+
+            return async_wrapper
+
+        sync_func = cast(Callable[P, T], func)
+        if should_check is None:
+
+            @wraps(func)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                result = sync_func(*args, **kwargs)
+                if not check(result):
+                    fail()
+                return result
+
+        else:
+            sampled = should_check
+
+            @wraps(func)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+                result = sync_func(*args, **kwargs)
+                if sampled() and not check(result):
+                    fail()
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def _checked(conditions: tuple[Callable[[Any], Any], ...], results: Any) -> Any:
+    """
+    Return `results` if every value meets every condition, else raise ValueError.
+
+    Iterables that are neither sequences nor arrays are checked as a list and
+    that list is returned in their place, the original would be exhausted.
+    """
+    if np is not None and isinstance(results, np.ndarray):
+        # conditions written for scalars (x % 2 == 0, x > n) broadcast over arrays
+        ok = all(bool(np.all(condition(results))) for condition in conditions)
+    else:
+        if isinstance(results, Sequence):
+            results = cast(Sequence[Any], results)
+        else:
+            results = list(cast(Iterable[Any], results))
+        ok = all(all(map(condition, results)) for condition in conditions)
+    if not ok:
+        raise ValueError("Return values did not meet required conditions")
+    return results
+
+
+def check_results(*conditions: Callable[[T], Any]):
+    """
+    Like `check_result`, for functions returning a sequence or NumPy array of values.
+
+    Any other iterable is returned as the list it was checked as.
+    """
+
+    def decorator(func: Callable[P, Any]) -> Callable[P, Any]:
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+            return _checked(conditions, func(*args, **kwargs))
 
         return wrapper
 
@@ -41,3 +193,11 @@ assert add(3, 5) == 8
 
 # add(1, 1)  # this would fail
 # add(4, 3)  # this would fail too
+
+
+@check_results(is_even, partial(larger_than, threshold=5))
+def double_all(values: list[int]) -> list[int]:
+    return [v * 2 for v in values]
+
+
+assert double_all([3, 4, 5]) == [6, 8, 10]
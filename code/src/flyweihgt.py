@@ -1,13 +1,88 @@
-from typing import ClassVar
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import Callable, ClassVar, Generic, Literal, MutableMapping, TypeVar
+from weakref import WeakValueDictionary
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+Policy = Literal["lru", "weak"]
+
+
+class FlyweightCache(Generic[K, V]):
+    """
+    Lookup-or-create cache for flyweight instances.
+
+    - "lru": keeps at most `maxsize` instances, evicting the least recently used.
+    - "weak": keeps an instance only while something else references it.
+    """
+
+    def __init__(self, policy: Policy = "lru", maxsize: int = 1024):
+        self.policy = policy
+        self.maxsize = maxsize
+        if policy == "lru":
+            lru: OrderedDict[K, V] = OrderedDict()
+            self._store: MutableMapping[K, V] = lru
+            self._touch: Callable[[K], None] | None = lru.move_to_end
+        else:
+            self._store = WeakValueDictionary()
+            self._touch = None
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def evictions(self) -> int:
+        # every miss inserts exactly one entry, anything no longer stored was evicted
+        return self.misses - len(self._store)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def get_or_create(self, key: K, factory: Callable[[K], V]) -> V:
+        with self._lock:
+            store = self._store
+            if (value := store.get(key)) is not None:
+                self.hits += 1
+                if self._touch:
+                    self._touch(key)
+                return value
+
+            self.misses += 1
+            store[key] = value = factory(key)
+            if self._touch and len(store) > self.maxsize:
+                del store[next(iter(store))]  # least recently used is first
+            return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+            self.hits = self.misses = 0
+
 
 class User:
-    _users: ClassVar[dict[tuple[str, int], "User"]] = {}
+    __slots__ = ("name", "age", "__weakref__")
+
+    _cache: ClassVar[FlyweightCache[tuple[str, int], "User"]] = FlyweightCache()
+
+    name: str
+    age: int
 
     def __new__(cls, name: str, age: int) -> "User":
-        if not (u := cls._users.get((name, age))):
-            cls._users[(name, age)] = u = super().__new__(cls)
-        return u
+        # attributes are set once on creation, a cache hit returns the instance untouched
+        return cls._cache.get_or_create((name, age), cls._create)
 
-    def __init__(self, name: str, age: int):
-       self.name = name
-       self.age = age
\ No newline at end of file
+    @classmethod
+    def configure(
+        cls, policy: Policy = "lru", maxsize: int = 1024
+    ) -> FlyweightCache[tuple[str, int], "User"]:
+        "Replace the instance cache, dropping every cached user, and return it."
+        cls._cache = FlyweightCache(policy, maxsize)
+        return cls._cache
+
+    @classmethod
+    def _create(cls, key: tuple[str, int]) -> "User":
+        u = super().__new__(cls)
+        u.name, u.age = key
+        return u
@@ -0,0 +1,135 @@
+"""
+Golden comparison and benchmark for `cli.to_kebab_case`.
+
+    python scripts/bench_kebab_case.py [--titles 50000] [--seed 0]
+
+Every title in the corpus is first checked against the original
+concatenation-based implementation (kept verbatim below); the script exits
+non-zero on the first mismatch. It then times both implementations on
+short titles, long titles and a repeated-title workload that hits the memo
+cache.
+"""
+
+import argparse
+import random
+import re
+import string
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from cli import BLOG_DIR, read_frontmatter, to_kebab_case  # noqa: E402
+
+
+def legacy_to_kebab_case(string: str) -> str:
+    if not string:
+        return string
+
+    result = ""
+    in_acronym = False
+
+    for i, char in enumerate(string):
+        if char.isupper():
+            if (i > 0 and not string[i - 1].isupper()) or i == 0:
+                if i > 0:  # Don't add hyphen at the beginning
+                    result += "-"
+                result += char.lower()
+                in_acronym = True
+
+            elif in_acronym and (i == len(string) - 1 or not string[i + 1].isupper()):
+                result += char.lower()
+                in_acronym = False
+            else:
+                result += char.lower()
+        else:
+            if i > 0 and string[i - 1].isupper() and not in_acronym:
+                result = result[:-1] + "-" + result[-1] + char
+            else:
+                result += char
+            in_acronym = False
+
+    result = re.sub(r"[\s_]+", "-", result)
+    return result
+
+
+WORDS = [
+    "HTTPException", "OAuth2PasswordBearer", "UserAPI", "lihil", "Design",
+    "patterns", "DI", "JSONResponse", "ASGI", "Python", "async", "IO",
+    "getHTTPResponseCode", "XMLHttpRequest", "v2", "README", "Ünïcödé",
+    "İstanbul", "ǅemal", "snake_case", "__dunder__", "ÀÉÎ", "AbCdEf",
+]
+SEPARATORS = [" ", "  ", "_", "__", " _ ", "\t", "\n", "　", "-", ""]
+ALPHABET = string.ascii_letters + string.digits + " _-.:'’!?—" + "ÄÖÜßİǅ"
+
+
+def build_corpus(n: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    corpus = [""]
+    if BLOG_DIR.exists():
+        corpus += [
+            str(read_frontmatter(p).get("title") or "")
+            for p in BLOG_DIR.glob("**/content.md")
+        ]
+    for _ in range(n // 2):
+        words = rng.choices(WORDS, k=rng.randint(1, 8))
+        seps = rng.choices(SEPARATORS, k=len(words))
+        corpus.append("".join(w + s for w, s in zip(words, seps)))
+    for _ in range(n - n // 2):
+        corpus.append("".join(rng.choices(ALPHABET, k=rng.randint(1, 60))))
+    return corpus
+
+
+def check_golden(corpus: list[str]) -> None:
+    for title in corpus:
+        expected, actual = legacy_to_kebab_case(title), to_kebab_case(title)
+        if expected != actual:
+            sys.exit(f"MISMATCH for {title!r}: {expected!r} != {actual!r}")
+    print(f"golden: {len(corpus)} titles match the original implementation")
+
+
+def bench(label: str, func, titles: list[str], number: int) -> float:
+    seconds = min(
+        timeit.repeat(lambda: [func(t) for t in titles], number=number, repeat=3)
+    )
+    per_call = seconds / (number * len(titles)) * 1e6
+    print(f"  {label:<10} {per_call:10.2f} us/title")
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--titles", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.titles, args.seed)
+    check_golden(corpus)
+
+    uncached = to_kebab_case.__wrapped__
+    rng = random.Random(args.seed)
+    workloads = {
+        "short titles": (rng.sample(corpus, min(2_000, len(corpus))), 5),
+        "long titles (20k chars)": (
+            ["".join(rng.choices(WORDS, k=2_000)) for _ in range(5)],
+            1,
+        ),
+    }
+    for name, (titles, number) in workloads.items():
+        print(name)
+        before = bench("legacy", legacy_to_kebab_case, titles, number)
+        after = bench("single", uncached, titles, number)
+        print(f"  speedup    {before / after:10.2f}x")
+
+    print("repeated titles (memo cache)")
+    repeated = rng.choices(corpus[:200], k=20_000)
+    to_kebab_case.cache_clear()
+    before = bench("legacy", legacy_to_kebab_case, repeated, 1)
+    after = bench("cached", to_kebab_case, repeated, 1)
+    print(f"  speedup    {before / after:10.2f}x")
+    print(f"  {to_kebab_case.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,31 @@
 import argparse
+import difflib
+import hashlib
+import json
 import logging
+import mmap
+import os
+import queue
 import re
+import shutil
+import sys
+import tempfile
+import threading
+from array import array
+from collections.abc import Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from datetime import datetime
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
 from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, quote, unquote, urlsplit
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -11,6 +34,13 @@ logger = logging.getLogger(__name__)
 
 ROOT_DIR = Path.cwd()
 BLOG_DIR = ROOT_DIR / "blog"
+CACHE_DIR = ROOT_DIR / ".cache" / "cli"
+INDEX_FILE = CACHE_DIR / "blog_index.json"
+ASSETS_DIR = CACHE_DIR / "assets"
+ASSETS_MANIFEST = ASSETS_DIR / "manifest.json"
+LINKS_CACHE = CACHE_DIR / "links.json"
+SECTIONS_CACHE = CACHE_DIR / "doc_sections.json"
+SEARCH_CACHE = CACHE_DIR / "search_files.json"
 
 # Global content template
 CONTENT = """---
@@ -24,6 +54,7 @@ toc_max_heading_level: {toc_max}
 """
 
 
+@lru_cache(maxsize=4096)
 def to_kebab_case(string: str) -> str:
     """
     Convert a string to kebab-case, properly handling acronyms.
@@ -32,38 +63,319 @@ def to_kebab_case(string: str) -> str:
         HTTPException -> http-exception
         UserAPI -> user-api
         OAuth2PasswordBearer -> o-auth2-password-bearer
+
+    Runs in a single pass over `string`, appending to a list buffer instead
+    of re-slicing the result, and collapses whitespace/underscore runs into
+    one hyphen as it goes. Results are memoized for repeated titles.
     """
     if not string:
         return string
 
-    result = ""
+    buf: list[str] = []
+    push = buf.append
     in_acronym = False
+    in_separator = False  # last output was a collapsed whitespace/underscore run
+    last = len(string) - 1
+    prev_upper = False
 
     for i, char in enumerate(string):
-        if char.isupper():
-            if (i > 0 and not string[i - 1].isupper()) or i == 0:
+        is_upper = char.isupper()
+        if is_upper:
+            lower = char.lower()
+            if not prev_upper:
                 if i > 0:  # Don't add hyphen at the beginning
-                    result += "-"
-                result += char.lower()
+                    push("-")
                 in_acronym = True
-
-            elif in_acronym and (i == len(string) - 1 or not string[i + 1].isupper()):
-                result += char.lower()
+            elif in_acronym and (i == last or not string[i + 1].isupper()):
                 in_acronym = False
-            else:
-                result += char.lower()
+            if len(lower) == 1:
+                push(lower)
+            else:  # e.g. "İ" lowers to two code points
+                buf.extend(lower)
+            in_separator = False
         else:
-            if i > 0 and string[i - 1].isupper() and not in_acronym:
-                result = result[:-1] + "-" + result[-1] + char
+            if prev_upper and not in_acronym:
+                # "...ABc" splits as "...a-bc": the hyphen goes before the last letter
+                buf.insert(len(buf) - 1, "-")
+            if char == "_" or char.isspace():
+                if not in_separator:
+                    push("-")
+                    in_separator = True
             else:
-                result += char
+                push(char)
+                in_separator = False
             in_acronym = False
+        prev_upper = is_upper
 
-    result = re.sub(r"[\s_]+", "-", result)
-    return result
+    return "".join(buf)
 
 
-def generate_blog_post(
+# ============ Frontmatter index ============
+
+FRONTMATTER_DELIMITER = "---"
+_LIST_ITEM = re.compile(r"^\s+-\s*(.*)$")
+_TOP_LEVEL_KEY = re.compile(r"^([^\s#][^:]*):")
+_DATE_PREFIX = re.compile(r"^(\d{4}-\d{2}-\d{2}(?:T\d{2}[_:]\d{2})?)-?")
+
+
+def _write_json_atomic(
+    path: Path, data: Any, indent: int | None = None, sort_keys: bool = False
+) -> None:
+    text = json.dumps(data, indent=indent, sort_keys=sort_keys)
+    if indent is not None:
+        text += "\n"  # pretty-printed files are committed, end them like any text file
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _strip_comment(value: str) -> str:
+    """
+    Drop a trailing `# comment`: a `#` at the start or after whitespace,
+    outside quotes.
+    """
+    quote = None
+    for i, char in enumerate(value):
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "\"'":
+            quote = char
+        elif char == "#" and (i == 0 or value[i - 1].isspace()):
+            return value[:i]
+    return value
+
+
+def _parse_scalar(value: str) -> Any:
+    value = _strip_comment(value).strip()
+    if value[:1] == "[" and value[-1:] == "]":
+        return [_parse_scalar(item) for item in value[1:-1].split(",") if item.strip()]
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    if value.lstrip("-").isdigit():
+        return int(value)
+    if value in ("true", "false"):
+        return value == "true"
+    return value
+
+
+def read_frontmatter(path: Path) -> dict[str, Any]:
+    """
+    Parse the leading `---` block of a markdown file.
+
+    Only the frontmatter lines are read; the body is never loaded. Supports
+    the subset of YAML our posts use: scalars, quoted strings, flow lists
+    (`[a, b]`) and block lists (`- a`).
+    """
+    meta: dict[str, Any] = {}
+    with path.open(encoding="utf-8") as f:
+        if f.readline().strip() != FRONTMATTER_DELIMITER:
+            return meta
+        key = None
+        for line in f:
+            if line.strip() == FRONTMATTER_DELIMITER:
+                break
+            if (item := _LIST_ITEM.match(line)) and key is not None:
+                if not isinstance(meta.get(key), list):
+                    meta[key] = []
+                meta[key].append(_parse_scalar(item.group(1)))
+            elif ":" in line and not line[:1].isspace():
+                key, _, value = line.partition(":")
+                key = key.strip()
+                meta[key] = _parse_scalar(value) if _strip_comment(value).strip() else None
+    return meta
+
+
+def read_yaml_keys(path: Path) -> set[str]:
+    """
+    Top-level keys of a mapping-style YAML file such as `tags.yml`.
+    """
+    if not path.exists():
+        return set()
+    with path.open(encoding="utf-8") as f:
+        return {m.group(1).strip() for line in f if (m := _TOP_LEVEL_KEY.match(line))}
+
+
+def _as_list(value: Any) -> list[str]:
+    """
+    Normalize list-ish CLI/frontmatter values, e.g. the `"[raceychan]"` default.
+    """
+    if value is None:
+        return []
+    if isinstance(value, str):
+        parsed = _parse_scalar(value)
+        return parsed if isinstance(parsed, list) else [parsed]
+    return [str(v) for v in value]
+
+
+class BlogIndex:
+    """
+    On-disk index of blog frontmatter, refreshed incrementally.
+
+    Entries are keyed by path relative to `ROOT_DIR`; a file is re-parsed
+    only when its mtime or size differ from the recorded values. Slugs,
+    titles, tags and authors are kept in dicts/sets for O(1) validation.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path = INDEX_FILE, blog_dir: Path = BLOG_DIR):
+        self.path = path
+        self.blog_dir = blog_dir
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.slugs: dict[str, str] = {}
+        self.titles: dict[str, str] = {}
+        self.known_tags: set[str] = set()
+        self.known_authors: set[str] = set()
+
+    @classmethod
+    def load(cls, path: Path = INDEX_FILE, blog_dir: Path = BLOG_DIR) -> "BlogIndex":
+        index = cls(path, blog_dir)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+        if data.get("version") == cls.VERSION:
+            index.entries = data["entries"]
+        index._rebuild_lookups()
+        return index
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(self.path, {"version": self.VERSION, "entries": self.entries})
+
+    def _iter_posts(self) -> Iterator[Path]:
+        for pattern in ("**/*.md", "**/*.mdx"):
+            yield from self.blog_dir.glob(pattern)
+
+    def _parse_entry(self, path: Path, stat: os.stat_result) -> dict[str, Any]:
+        meta = read_frontmatter(path)
+        post_dir = path.parent if path.stem in ("index", "content") else path
+        name = post_dir.stem if post_dir is path else post_dir.name
+        date_match = _DATE_PREFIX.match(name)
+        return {
+            "slug": str(meta.get("slug") or name[date_match.end() if date_match else 0 :]),
+            "title": str(meta.get("title") or ""),
+            "date": str(meta.get("date") or (date_match.group(1) if date_match else "")),
+            "authors": _as_list(meta.get("authors")),
+            "tags": _as_list(meta.get("tags")),
+            "path": str(path.relative_to(ROOT_DIR)),
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
+
+    def refresh(self) -> dict[str, int]:
+        """
+        Sync the index with the blog directory, returning change counts.
+        """
+        seen: set[str] = set()
+        stats = {"parsed": 0, "unchanged": 0, "removed": 0}
+        for path in self._iter_posts():
+            stat = path.stat()
+            key = str(path.relative_to(ROOT_DIR))
+            seen.add(key)
+            old = self.entries.get(key)
+            if old and old["mtime"] == stat.st_mtime_ns and old["size"] == stat.st_size:
+                stats["unchanged"] += 1
+                continue
+            self.entries[key] = self._parse_entry(path, stat)
+            stats["parsed"] += 1
+        for key in self.entries.keys() - seen:
+            del self.entries[key]
+            stats["removed"] += 1
+        self._rebuild_lookups()
+        return stats
+
+    def _rebuild_lookups(self) -> None:
+        self.slugs = {e["slug"]: key for key, e in self.entries.items()}
+        self.titles = {e["title"].casefold(): key for key, e in self.entries.items()}
+        self.reload_registries()
+
+    def reload_registries(self) -> None:
+        """
+        Re-read the tag and author keys from `tags.yml` and `authors.yml`.
+        """
+        self.known_tags = read_yaml_keys(self.blog_dir / "tags.yml")
+        self.known_authors = read_yaml_keys(self.blog_dir / "authors.yml")
+
+    def validate(
+        self, slug: str, title: str, authors: Any, tags: Any, path: str | None = None
+    ) -> list[str]:
+        """
+        Problems that would stop a new post from being created.
+
+        Pass `path` when validating an existing post so that it does not
+        collide with its own slug and title.
+        """
+        errors: list[str] = []
+        if self.slugs.get(slug, path) != path:
+            errors.append(f"Slug '{slug}' is already used by {self.slugs[slug]}")
+        if self.titles.get(title.casefold(), path) != path:
+            errors.append(f"Title '{title}' is already used by {self.titles[title.casefold()]}")
+        if self.known_authors:
+            if unknown := [a for a in _as_list(authors) if a not in self.known_authors]:
+                errors.append(f"Unknown authors (not in authors.yml): {', '.join(unknown)}")
+        if self.known_tags:
+            if unknown := [t for t in _as_list(tags) if t not in self.known_tags]:
+                errors.append(f"Unknown tags (not in tags.yml): {', '.join(unknown)}")
+        return errors
+
+    def update(self, path: Path) -> None:
+        """
+        (Re)index a single post, e.g. one that was just written.
+        """
+        entry = self._parse_entry(path, path.stat())
+        self.remove(entry["path"])
+        self.entries[entry["path"]] = entry
+        self.claim(entry["slug"], entry["title"], entry["path"])
+
+    def remove(self, key: str) -> None:
+        """
+        Drop a post and release its slug/title, e.g. after it was deleted.
+        """
+        if (old := self.entries.pop(key, None)) is None:
+            return
+        if self.slugs.get(old["slug"]) == key:
+            del self.slugs[old["slug"]]
+        if self.titles.get(old["title"].casefold()) == key:
+            del self.titles[old["title"].casefold()]
+
+    def claim(self, slug: str, title: str, path: str) -> None:
+        """
+        Reserve a slug/title for a post that is about to be written.
+        """
+        self.slugs[slug] = path
+        self.titles[title.casefold()] = path
+
+
+def build_index(json_output: bool = False) -> BlogIndex:
+    start = datetime.now()
+    index = BlogIndex.load()
+    stats = index.refresh()
+    index.save()
+    elapsed = (datetime.now() - start).total_seconds()
+    if json_output:
+        print(
+            json.dumps(
+                {
+                    "success": True,
+                    "message": "Blog index updated",
+                    "path": str(index.path.relative_to(ROOT_DIR)),
+                    "posts": len(index.entries),
+                    **stats,
+                    "elapsed_seconds": round(elapsed, 3),
+                }
+            )
+        )
+    else:
+        logger.info(
+            f"Indexed {len(index.entries)} posts "
+            f"({stats['parsed']} parsed, {stats['unchanged']} unchanged, "
+            f"{stats['removed']} removed) in {elapsed:.3f}s"
+        )
+    return index
+
+
+def create_blog_post(
     title: str,
     authors: list[str],
     tags: list[str],
@@ -71,9 +383,11 @@ def generate_blog_post(
     toc_min: int = 2,
     toc_max: int = 5,
     content_body: str = "",
-    images: list[str] = None,
-    json_output: bool = False,
-):
+    images: list[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Write the post directory and its content.md, without any reporting.
+    """
     images = images or []
     date_str = date or datetime.now().strftime("%Y-%m-%dT%H:%M")
     slug = to_kebab_case(title)
@@ -90,14 +404,14 @@ def generate_blog_post(
         toc_min=toc_min,
         toc_max=toc_max,
     )
-    
+
     # Combine frontmatter with body content
     full_content = frontmatter_content + "\n" + content_body
 
     # Create content.md file
     content_file = blog_dir / "content.md"
     content_file.write_text(full_content, encoding="utf-8")
-    
+
     # Create placeholder files for images
     created_files = ["content.md"]
     for image_name in images:
@@ -105,27 +419,1515 @@ def generate_blog_post(
         if not image_file.exists():
             image_file.touch()  # Create empty file
             created_files.append(image_name)
-    
+
+    return {
+        "dir_name": dir_name,
+        "path": str(content_file),
+        "created_files": created_files,
+    }
+
+
+def generate_blog_post(
+    title: str,
+    authors: list[str],
+    tags: list[str],
+    date: str | None = None,
+    toc_min: int = 2,
+    toc_max: int = 5,
+    content_body: str = "",
+    images: list[str] = None,
+    json_output: bool = False,
+    validate: bool = True,
+):
+    index = BlogIndex.load()
+    index.refresh()
+    if validate:
+        if errors := index.validate(to_kebab_case(title), title, authors, tags):
+            raise ValueError("; ".join(errors))
+
+    post = create_blog_post(
+        title=title,
+        authors=authors,
+        tags=tags,
+        date=date,
+        toc_min=toc_min,
+        toc_max=toc_max,
+        content_body=content_body,
+        images=images,
+    )
+    content_file = Path(post["path"])
+    index.update(content_file)
+    index.save()
+
     if json_output:
-        import json
         result = {
             "success": True,
             "message": "Blog post created successfully",
-            "dir_name": dir_name,
+            "dir_name": post["dir_name"],
             "path": str(content_file.relative_to(ROOT_DIR)),
-            "created_files": created_files
+            "created_files": post["created_files"],
         }
         print(json.dumps(result))
     else:
         logger.info(f"Blog post created at: {content_file}")
         if images:
             logger.info(f"Image placeholders created: {', '.join(images)}")
-    
+
+    return post
+
+
+# ============ Batch generation ============
+
+# Manifest keys accepted per entry, mapped to `create_blog_post` arguments.
+MANIFEST_FIELDS = {
+    "title": "title",
+    "authors": "authors",
+    "tags": "tags",
+    "date": "date",
+    "toc_min": "toc_min",
+    "toc_min_heading_level": "toc_min",
+    "toc_max": "toc_max",
+    "toc_max_heading_level": "toc_max",
+    "content": "content_body",
+    "images": "images",
+}
+
+
+def iter_manifest(path: Path) -> Iterator[tuple[int, Any, str | None]]:
+    """
+    Lazily yield `(line_no, entry, error)` triples from a manifest.
+
+    `.jsonl` manifests hold one JSON object per line; `.yml`/`.yaml`
+    manifests hold one YAML document per entry, separated by `---`.
+    Only one entry is held in memory at a time. A line that fails to parse
+    is yielded with its error instead of aborting the run; a YAML stream
+    cannot be resumed after a parse error, so it ends there.
+    """
+    with path.open(encoding="utf-8") as f:
+        if path.suffix in (".yml", ".yaml"):
+            import yaml  # only needed for YAML manifests
+
+            documents = enumerate(yaml.safe_load_all(f), start=1)
+            while True:
+                try:
+                    no, entry = next(documents)
+                except StopIteration:
+                    return
+                except yaml.YAMLError as exc:
+                    mark = getattr(exc, "problem_mark", None)
+                    yield (mark.line + 1 if mark else 0), None, f"Invalid YAML: {exc}"
+                    return
+                if entry is not None:
+                    yield no, entry, None
+
+        for no, line in enumerate(f, start=1):
+            line = line.strip()
+            if line and not line.startswith("#"):
+                try:
+                    yield no, json.loads(line), None
+                except json.JSONDecodeError as exc:
+                    yield no, None, f"Invalid JSON: {exc}"
+
+
+def _manifest_kwargs(entry: Any) -> dict[str, Any]:
+    if not isinstance(entry, dict):
+        raise ValueError(f"Manifest entry must be an object, got {type(entry).__name__}")
+    unknown = set(entry) - MANIFEST_FIELDS.keys()
+    if unknown:
+        raise ValueError(f"Unknown manifest fields: {', '.join(sorted(map(str, unknown)))}")
+    if not entry.get("title"):
+        raise ValueError("Manifest entry is missing a title")
+    if not isinstance(entry["title"], str):
+        raise ValueError("Manifest entry title must be a string")
+    kwargs = {MANIFEST_FIELDS[key]: value for key, value in entry.items()}
+    kwargs.setdefault("authors", ["raceychan"])
+    kwargs.setdefault("tags", [])
+    return kwargs
+
+
+def iter_validated_entries(
+    entries: Iterable[tuple[int, Any, str | None]],
+    index: BlogIndex | None = None,
+) -> Iterator[tuple[int, dict[str, Any] | None, str | None]]:
+    """
+    Turn manifest entries into `(line_no, kwargs, error)` work items.
+
+    Validation runs in the parent process against `index`, claiming each
+    slug as it goes so duplicates within the manifest are caught too.
+    Invalid entries keep their error and are reported by the worker.
+    """
+    for line_no, entry, error in entries:
+        if error is not None:
+            yield line_no, None, error
+            continue
+        try:
+            kwargs = _manifest_kwargs(entry)
+        except (ValueError, TypeError) as exc:
+            yield line_no, None, str(exc)
+            continue
+        if index is not None:
+            slug = to_kebab_case(kwargs["title"])
+            errors = index.validate(slug, kwargs["title"], kwargs["authors"], kwargs["tags"])
+            if errors:
+                yield line_no, None, "; ".join(errors)
+                continue
+            index.claim(slug, kwargs["title"], f"manifest line {line_no}")
+        yield line_no, kwargs, None
+
+
+def _create_blog_chunk(
+    chunk: list[tuple[int, dict[str, Any] | None, str | None]],
+) -> list[dict[str, Any]]:
+    """
+    Worker entry point: create every post in `chunk`, never raising.
+    """
+    results: list[dict[str, Any]] = []
+    for line_no, kwargs, error in chunk:
+        if error is not None:
+            results.append({"success": False, "line": line_no, "message": error})
+            continue
+        try:
+            post = create_blog_post(**kwargs)
+        except Exception as exc:
+            results.append({"success": False, "line": line_no, "message": str(exc)})
+            continue
+        results.append(
+            {
+                "success": True,
+                "line": line_no,
+                "message": "Blog post created successfully",
+                "dir_name": post["dir_name"],
+                "path": str(Path(post["path"]).relative_to(ROOT_DIR)),
+                "created_files": post["created_files"],
+            }
+        )
+    return results
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def _pool_map_chunks(
+    func: Any, items: Iterable[Any], workers: int | None, chunk_size: int
+) -> Iterator[Any]:
+    """
+    Run `func` over chunks of `items` in a process pool, yielding each
+    result of `func` (an iterable) as its chunk finishes.
+
+    At most `2 * workers` chunks are in flight, so memory stays bounded
+    by the window rather than by the number of items.
+    """
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunked(items, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(func, c) for c in islice(chunks, 2 * workers)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+                if (chunk := next(chunks, None)) is not None:
+                    pending.add(pool.submit(func, chunk))
+
+
+def iter_batch_results(
+    entries: Iterable[tuple[int, dict[str, Any] | None, str | None]],
+    workers: int | None = None,
+    chunk_size: int = 64,
+) -> Iterator[dict[str, Any]]:
+    """
+    Create posts with a process pool, yielding results as chunks finish.
+    """
+    return _pool_map_chunks(_create_blog_chunk, entries, workers, chunk_size)
+
+
+def generate_blog_batch(
+    manifest: Path,
+    workers: int | None = None,
+    chunk_size: int = 64,
+    out=sys.stdout,
+    validate: bool = True,
+) -> dict[str, Any]:
+    """
+    Create every post in `manifest` and stream one aggregated JSON report.
+
+    Per-post entries share the shape of `blog --json`; the summary keys
+    are written after the `posts` array so nothing has to be buffered.
+    """
+    start = datetime.now()
+    created = failed = 0
+    aborted = None
+    index = BlogIndex.load()
+    index.refresh()
+    items = iter_validated_entries(iter_manifest(manifest), index if validate else None)
+
+    out.write('{"posts": [')
+    try:
+        for i, result in enumerate(iter_batch_results(items, workers, chunk_size)):
+            if i:
+                out.write(", ")
+            out.write(json.dumps(result))
+            if result["success"]:
+                created += 1
+            else:
+                failed += 1
+    except Exception as exc:
+        # keep the report well-formed and the index in sync with what was written
+        aborted = f"Batch aborted: {exc}"
+    finally:
+        index.refresh()
+        index.save()
+
+    elapsed = (datetime.now() - start).total_seconds()
+    message = f"Created {created} blog posts, {failed} failed"
+    summary = {
+        "success": failed == 0 and aborted is None,
+        "message": f"{aborted}. {message}" if aborted else message,
+        "created": created,
+        "failed": failed,
+        "elapsed_seconds": round(elapsed, 3),
+        "posts_per_second": round(created / elapsed, 1) if elapsed else None,
+    }
+    out.write("], " + json.dumps(summary)[1:] + "\n")
+    return summary
+
+
+# ============ Assets ============
+
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
+SIDECAR_MARKER = ":Zone.Identifier"
+VARIANT_WIDTHS = (480, 960, 1920)
+VARIANT_QUALITY = 82
+
+
+def hash_file(path: Path) -> str:
+    """
+    sha256 of a file, read through a memory map rather than into a buffer.
+    """
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
+
+LOSSY_SUFFIXES = {".jpg", ".jpeg", ".webp"}
+
+
+def _variant_name(digest: str, width: int | None, suffix: str) -> str:
+    size = f"{width}w" if width else "full"
+    quality = f"-q{VARIANT_QUALITY}" if suffix in LOSSY_SUFFIXES else ""
+    return f"{digest}-{size}{quality}{suffix}"
+
+
+def _build_variants(
+    src: str, digest: str, widths: tuple[int, ...], out_dir: str
+) -> list[str]:
+    """
+    Worker entry point: write recompressed and downscaled copies of `src`.
+
+    Output names are derived from the content hash, so a variant that
+    already exists on disk is never rebuilt. A variant that comes out no
+    smaller than the source is discarded.
+    """
+    from PIL import Image
+
+    source = Path(src)
+    source_size = source.stat().st_size
+    suffix = source.suffix.lower()
+    built: list[str] = []
+    with Image.open(source) as img:
+        targets = [None] + [w for w in widths if w < img.width]
+        for width in targets:
+            dest = Path(out_dir) / _variant_name(digest, width, suffix)
+            if dest.exists():
+                continue
+            variant = img.copy()
+            if width:
+                variant.thumbnail((width, round(img.height * width / img.width)))
+            tmp = dest.with_name(dest.name + ".tmp")
+            if suffix in (".jpg", ".jpeg"):
+                variant.convert("RGB").save(
+                    tmp, "JPEG", quality=VARIANT_QUALITY, optimize=True, progressive=True
+                )
+            elif suffix == ".webp":
+                variant.save(tmp, "WEBP", quality=VARIANT_QUALITY, method=6)
+            else:
+                variant.save(tmp, img.format, optimize=True)
+            if tmp.stat().st_size >= source_size:
+                tmp.unlink()
+                continue
+            os.replace(tmp, dest)
+            built.append(dest.name)
+    return built
+
+
+def _link_to_store(paths: list[Path], stored: Path, digest: str) -> list[Path]:
+    """
+    Replace every copy in `paths` with a hardlink to `stored`.
+
+    The store holds its own copy of the content rather than sharing an
+    inode with one of the originals, and every file is hashed again right
+    before it is replaced, so a file edited since it was hashed is left
+    alone. Returns the paths that were replaced.
+    """
+    if not stored.exists() or hash_file(stored) != digest:
+        tmp = stored.with_name(stored.name + ".tmp")
+        shutil.copyfile(paths[0], tmp)
+        if hash_file(tmp) != digest:
+            tmp.unlink()
+            return []
+        os.replace(tmp, stored)
+
+    linked: list[Path] = []
+    for path in paths:
+        if path.samefile(stored) or hash_file(path) != digest:
+            continue
+        tmp = path.with_name(path.name + ".tmp")
+        os.link(stored, tmp)
+        os.replace(tmp, path)
+        linked.append(path)
+    return linked
+
+
+def process_assets(
+    roots: Iterable[Path] | None = None,
+    dedupe: bool = True,
+    variants: bool = True,
+    widths: tuple[int, ...] = VARIANT_WIDTHS,
+    workers: int | None = None,
+    dry_run: bool = False,
+    json_output: bool = False,
+) -> dict[str, Any]:
+    """
+    Hash, dedupe and optimize every image under `roots`.
+
+    1. `:Zone.Identifier` sidecars are deleted.
+    2. Images are hashed (mmap + thread pool); files whose mtime and size
+       match the manifest reuse their recorded hash.
+    3. Content found in more than one file is copied once to
+       `.cache/cli/assets/store` and the duplicates are replaced by
+       hardlinks to that copy, so references in markdown keep working
+       unchanged. Unique files are never linked.
+    4. Variants are built by a process pool (requires Pillow) for hashes
+       not yet processed with the requested widths. They are written to
+       `.cache/cli/assets/variants` only; the site build does not use
+       them yet.
+    """
+    start = datetime.now()
+    roots = list(roots or (ROOT_DIR / "static", BLOG_DIR))
+    store_dir, variants_dir = ASSETS_DIR / "store", ASSETS_DIR / "variants"
+    if not dry_run:
+        store_dir.mkdir(parents=True, exist_ok=True)
+        variants_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        manifest = json.loads(ASSETS_MANIFEST.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        manifest = {}
+    files: dict[str, Any] = manifest.get("files", {})
+    built_widths: dict[str, list[int]] = manifest.get("variants", {})
+
+    report: dict[str, Any] = {
+        "images": 0,
+        "hashed": 0,
+        "unique": 0,
+        "linked": 0,
+        "bytes_saved": 0,
+        "sidecars_removed": [],
+        "variants_built": 0,
+        "variants_skipped": None,
+    }
+
+    images: list[tuple[Path, os.stat_result]] = []
+    for root in roots:
+        for path in root.rglob("*"):
+            if not path.is_file():
+                continue
+            if SIDECAR_MARKER in path.name:
+                report["sidecars_removed"].append(str(path.relative_to(ROOT_DIR)))
+                if not dry_run:
+                    path.unlink()
+            elif path.suffix.lower() in IMAGE_SUFFIXES:
+                # empty files are `blog --images` placeholders, never dedupe those
+                if (stat := path.stat()).st_size:
+                    images.append((path, stat))
+    report["images"] = len(images)
+
+    def digest_of(item: tuple[Path, os.stat_result]) -> tuple[Path, str, bool]:
+        path, stat = item
+        old = files.get(str(path.relative_to(ROOT_DIR)))
+        if old and old["mtime"] == stat.st_mtime_ns and old["size"] == stat.st_size:
+            return path, old["sha256"], False
+        return path, hash_file(path), True
+
+    by_digest: dict[str, list[Path]] = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for path, digest, hashed in pool.map(digest_of, images):
+            by_digest.setdefault(digest, []).append(path)
+            report["hashed"] += hashed
+    report["unique"] = len(by_digest)
+
+    new_files: dict[str, Any] = {}
+    for digest, paths in by_digest.items():
+        if dedupe and len(paths) > 1:
+            stored = store_dir / f"{digest}{paths[0].suffix.lower()}"
+            size, new_copy = paths[0].stat().st_size, not stored.exists()
+            if dry_run:
+                linked = [p for p in paths if not (stored.exists() and p.samefile(stored))]
+            else:
+                linked = _link_to_store(paths, stored, digest)
+            report["linked"] += len(linked)
+            # every linked file frees its copy, but a new store entry takes one back
+            if linked:
+                report["bytes_saved"] += (len(linked) - new_copy) * size
+        for path in paths:
+            stat = path.stat()
+            new_files[str(path.relative_to(ROOT_DIR))] = {
+                "sha256": digest,
+                "mtime": stat.st_mtime_ns,
+                "size": stat.st_size,
+            }
+
+    if variants and not dry_run:
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            report["variants_skipped"] = "Pillow is not installed"
+        else:
+            wanted = sorted(widths)
+            todo = [
+                (str(paths[0]), digest)
+                for digest, paths in by_digest.items()
+                if paths[0].suffix.lower() != ".gif"
+                and built_widths.get(digest) != wanted
+            ]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    digest: pool.submit(
+                        _build_variants, src, digest, widths, str(variants_dir)
+                    )
+                    for src, digest in todo
+                }
+                for digest, future in futures.items():
+                    report["variants_built"] += len(future.result())
+                    built_widths[digest] = wanted
+
+    if not dry_run:
+        ASSETS_MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(
+            ASSETS_MANIFEST, {"files": new_files, "variants": built_widths}
+        )
+
+    report["elapsed_seconds"] = round((datetime.now() - start).total_seconds(), 3)
+    if json_output:
+        print(json.dumps({"success": True, "dry_run": dry_run, **report}))
+    else:
+        logger.info(
+            f"{report['images']} images ({report['hashed']} hashed, "
+            f"{report['unique']} unique), {report['linked']} deduplicated "
+            f"({report['bytes_saved']} bytes), "
+            f"{len(report['sidecars_removed'])} sidecars removed, "
+            f"{report['variants_built']} variants built "
+            f"in {report['elapsed_seconds']}s"
+        )
+        if report["variants_skipped"]:
+            logger.warning(f"Variants skipped: {report['variants_skipped']}")
+    return report
+
+
+# ============ Link checker ============
+
+MARKDOWN_ROOTS = ("blog", "docs", "i18n")
+MARKDOWN_SUFFIXES = {".md", ".mdx"}
+# [text](target "title") / ![alt](target), plus <img src="target">
+_INLINE_LINK = re.compile(r"!?\[[^\]]*\]\(\s*<?([^\s)>]+)>?(?:\s+[\"'(][^)]*)?\)")
+_HTML_SRC = re.compile(r"<img\b[^>]*\bsrc=[\"']([^\"']+)[\"']", re.IGNORECASE)
+_REFERENCE_LINK = re.compile(r"^\s{0,3}\[[^\]]+\]:\s*<?(\S+?)>?(?:\s|$)")
+_INLINE_CODE = re.compile(r"`+[^`]*`+")
+_EXTERNAL = re.compile(r"^(?:[a-zA-Z][\w+.-]*:|//|#)")
+LINKS_CACHE_VERSION = 2
+
+
+def extract_links(text: str) -> list[tuple[int, str]]:
+    """
+    `(line_no, target)` for every local link or image in a markdown text.
+
+    Fenced code blocks, inline code and `<!-- -->` comments (which may span
+    lines) are skipped, as are external URLs and same-page anchors.
+    """
+    links: list[tuple[int, str]] = []
+    fence = None
+    in_comment = False
+    for no, line in enumerate(text.splitlines(), start=1):
+        if in_comment:
+            if (end := line.find("-->")) < 0:
+                continue
+            line, in_comment = line[end + 3 :], False
+        stripped = line.lstrip()
+        if stripped.startswith(("```", "~~~")):
+            marker = stripped[:3]
+            if fence is None:
+                fence = marker
+            elif marker == fence:
+                fence = None
+            continue
+        if fence is not None:
+            continue
+        line = _INLINE_CODE.sub("", line)
+        visible = []
+        while (start := line.find("<!--")) >= 0:
+            visible.append(line[:start])
+            if (end := line.find("-->", start + 4)) < 0:
+                line, in_comment = "", True
+                break
+            line = line[end + 3 :]
+        line = "".join(visible) + line
+        targets = _INLINE_LINK.findall(line) + _HTML_SRC.findall(line)
+        if ref := _REFERENCE_LINK.match(line):
+            targets.append(ref.group(1))
+        links.extend((no, t) for t in targets if not _EXTERNAL.match(t))
+    return links
+
+
+def _link_candidates(source: Path, target: str) -> list[str]:
+    """
+    Filesystem paths (relative to `ROOT_DIR`) any one of which satisfies `target`.
+
+    Returns an empty list for site routes that do not map onto a file.
+    """
+    target = unquote(target.split("#", 1)[0].split("?", 1)[0])
+    if not target:
+        return []
+    if target.startswith("/"):
+        # absolute links are site routes; only files served from static/ can be checked
+        if not Path(target).suffix or Path(target).suffix in MARKDOWN_SUFFIXES:
+            return []
+        base = ROOT_DIR / "static" / target.lstrip("/")
+        candidates = [base]
+    else:
+        base = source.parent / target
+        candidates = [base]
+        if not base.suffix:
+            candidates += [
+                base.with_name(base.name + ".md"),
+                base.with_name(base.name + ".mdx"),
+                base / "index.md",
+            ]
+    return [os.path.relpath(c, ROOT_DIR) for c in candidates]
+
+
+def _scan_markdown(path: Path, cached: dict[str, Any] | None) -> dict[str, Any]:
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if cached and cached["sha256"] == digest:
+        return cached
+    links = [
+        {"line": no, "target": target, "candidates": candidates}
+        for no, target in extract_links(data.decode("utf-8", errors="replace"))
+        if (candidates := _link_candidates(path, target))
+    ]
+    return {"sha256": digest, "links": links}
+
+
+def check_links(
+    roots: Iterable[str] = MARKDOWN_ROOTS,
+    workers: int | None = None,
+    json_output: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Report relative links and image references that do not resolve.
+
+    Extracted links are cached per file keyed by its content hash; on a
+    rerun only files whose hash changed are re-parsed, while every cached
+    target is still re-checked with a cheap existence test so deleted or
+    renamed targets are caught.
+    """
+    start = datetime.now()
+    try:
+        cache = json.loads(LINKS_CACHE.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
+    cache = cache.get("files", {}) if cache.get("version") == LINKS_CACHE_VERSION else {}
+
+    files = [
+        path
+        for root in roots
+        for path in (ROOT_DIR / root).rglob("*")
+        if path.suffix in MARKDOWN_SUFFIXES and path.is_file()
+    ]
+    keys = [os.path.relpath(path, ROOT_DIR) for path in files]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        scanned = list(pool.map(lambda p, k: _scan_markdown(p, cache.get(k)), files, keys))
+
+    new_cache = dict(zip(keys, scanned))
+    reparsed = sum(1 for k in keys if cache.get(k) is not new_cache[k])
+    broken = [
+        {"file": key, "line": link["line"], "target": link["target"]}
+        for key, result in new_cache.items()
+        for link in result["links"]
+        if not any(os.path.exists(ROOT_DIR / c) for c in link["candidates"])
+    ]
+
+    LINKS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    _write_json_atomic(LINKS_CACHE, {"version": LINKS_CACHE_VERSION, "files": new_cache})
+
+    elapsed = (datetime.now() - start).total_seconds()
+    if json_output:
+        print(
+            json.dumps(
+                {
+                    "success": not broken,
+                    "message": f"{len(broken)} broken links in {len(keys)} files",
+                    "files": len(keys),
+                    "reparsed": reparsed,
+                    "broken": broken,
+                    "elapsed_seconds": round(elapsed, 3),
+                }
+            )
+        )
+    else:
+        for item in broken:
+            logger.error(f"{item['file']}:{item['line']}: broken link {item['target']}")
+        logger.info(
+            f"Checked {len(keys)} files ({reparsed} re-parsed), "
+            f"{len(broken)} broken links in {elapsed:.3f}s"
+        )
+    return broken
+
+
+# ============ Translation tracking ============
+
+DOCS_DIR = ROOT_DIR / "docs"
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+
+
+def translation_dir(locale: str) -> Path:
+    return ROOT_DIR / "i18n" / locale / "docusaurus-plugin-content-docs" / "current"
+
+
+def translation_state_file(locale: str) -> Path:
+    return ROOT_DIR / "i18n" / locale / "translation-hashes.json"
+
+
+def section_hashes(path: Path) -> dict[str, str]:
+    """
+    Hash of each heading-delimited section of a markdown file.
+
+    Keys are the heading line (e.g. `## Config`), suffixed with `#n` when a
+    heading repeats; text before the first heading is keyed `(preamble)`.
+    Headings inside fenced code blocks do not start a section.
+    """
+    sections: dict[str, str] = {}
+    key, digest = "(preamble)", hashlib.sha256()
+    fence = None
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            stripped = line.lstrip()
+            if stripped.startswith(("```", "~~~")):
+                fence = None if fence == stripped[:3] else fence or stripped[:3]
+            elif fence is None and (m := _HEADING.match(line)):
+                sections[key] = digest.hexdigest()
+                key = f"{m.group(1)} {m.group(2)}"
+                n = 1
+                while key in sections:
+                    n += 1
+                    key = f"{m.group(1)} {m.group(2)}#{n}"
+                digest = hashlib.sha256()
+            digest.update(line.encode("utf-8"))
+    sections[key] = digest.hexdigest()
+    return sections
+
+
+def _load_translation_state(locale: str) -> dict[str, Any]:
+    try:
+        return json.loads(translation_state_file(locale).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def _current_section_hashes(
+    path: Path, rel: str, cache: dict[str, Any]
+) -> dict[str, str]:
+    """
+    `section_hashes` for a doc, served from the local stat-keyed cache when
+    the file's mtime and size are unchanged.
+    """
+    stat = path.stat()
+    cached = cache.get(rel)
+    if cached and cached["mtime"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+        return cached["sections"]
+    sections = section_hashes(path)
+    cache[rel] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "sections": sections}
+    return sections
+
+
+def _load_sections_cache() -> dict[str, Any]:
+    try:
+        return json.loads(SECTIONS_CACHE.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_sections_cache(cache: dict[str, Any]) -> None:
+    SECTIONS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    _write_json_atomic(SECTIONS_CACHE, cache)
+
+
+def _iter_docs() -> Iterator[Path]:
+    for dirpath, _, filenames in os.walk(DOCS_DIR):
+        for name in sorted(filenames):
+            if Path(name).suffix in MARKDOWN_SUFFIXES:
+                yield Path(dirpath) / name
+
+
+def mark_translated(
+    locale: str, paths: Iterable[Path] | None = None, json_output: bool = False
+) -> list[str]:
+    """
+    Record the current section hashes of source docs as translated.
+
+    Without `paths`, every doc that has a translation in `locale` is marked.
+    Raises ValueError if one of `paths` is not under `docs/`.
+    """
+    docs = [path.resolve() for path in paths] if paths else list(_iter_docs())
+    for path in docs:
+        if not path.is_relative_to(DOCS_DIR):
+            raise ValueError(f"{path} is not under {DOCS_DIR}")
+
+    state = _load_translation_state(locale)
+    cache = _load_sections_cache()
+    target = translation_dir(locale)
+    marked: list[str] = []
+    for path in docs:
+        rel = path.relative_to(DOCS_DIR).as_posix()
+        if not (target / rel).exists():
+            continue
+        state[rel] = _current_section_hashes(path, rel, cache)
+        marked.append(rel)
+    _save_sections_cache(cache)
+
+    state_file = translation_state_file(locale)
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    _write_json_atomic(state_file, state, indent=2, sort_keys=True)
+    if json_output:
+        print(json.dumps({"success": True, "locale": locale, "marked": marked}))
+    else:
+        logger.info(f"Marked {len(marked)} docs as translated for '{locale}'")
+    return marked
+
+
+def iter_translation_status(locale: str) -> Iterator[dict[str, Any]]:
+    """
+    Yield one record per doc whose `locale` translation is not up to date.
+
+    The recorded state only holds section hashes so it can be committed;
+    current hashes come from a local cache keyed by mtime and size, so only
+    docs edited since the last run are read.
+    """
+    state = _load_translation_state(locale)
+    cache = _load_sections_cache()
+    target = translation_dir(locale)
+    seen: set[str] = set()
+    for path in _iter_docs():
+        rel = path.relative_to(DOCS_DIR).as_posix()
+        seen.add(rel)
+        if not (target / rel).exists():
+            yield {"doc": rel, "status": "missing"}
+            continue
+        if (old := state.get(rel)) is None:
+            yield {"doc": rel, "status": "untracked"}
+            continue
+        new = _current_section_hashes(path, rel, cache)
+        if new == old:
+            continue
+        changed = [k for k in new if k in old and old[k] != new[k]]
+        added = [k for k in new if k not in old]
+        removed = [k for k in old if k not in new]
+        if changed or added or removed:
+            yield {
+                "doc": rel,
+                "status": "stale",
+                "changed": changed,
+                "added": added,
+                "removed": removed,
+            }
+    for rel in sorted(state.keys() - seen):
+        yield {"doc": rel, "status": "orphaned"}
+    _save_sections_cache(cache)
+
+
+def translation_status(locale: str, json_output: bool = False) -> list[dict[str, Any]]:
+    start = datetime.now()
+    report = list(iter_translation_status(locale))
+    elapsed = (datetime.now() - start).total_seconds()
+    if json_output:
+        print(
+            json.dumps(
+                {
+                    "success": not report,
+                    "locale": locale,
+                    "message": f"{len(report)} docs need translation work",
+                    "docs": report,
+                    "elapsed_seconds": round(elapsed, 3),
+                }
+            )
+        )
+    else:
+        for item in report:
+            sections = item.get("changed", []) + item.get("added", [])
+            detail = f": {', '.join(sections)}" if sections else ""
+            logger.info(f"[{item['status']}] {item['doc']}{detail}")
+        logger.info(f"{len(report)} docs need translation work for '{locale}'")
+    return report
+
+
+# ============ Search index ============
+
+SEARCH_ROOTS = ("blog", "docs", "i18n")
+SEARCH_SHARD_PREFIX = 2
+SEARCH_UNICODE_BUCKETS = 64
+SEARCH_INDEX_VERSION = 2
+_WORD = re.compile(r"[^\W_]+")
+_CJK = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]+")
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have if in into is it its of on "
+    "or that the their then there these this to was were will with you your".split()
+)
+
+
+def iter_tokens(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Lazily yield lowercase search terms from markdown lines.
+
+    Latin words are yielded whole (minus stopwords); runs of CJK text, which
+    have no spaces, are yielded as overlapping bigrams.
+    """
+    for line in lines:
+        for word in _WORD.findall(line.casefold()):
+            if not _CJK.search(word):
+                if len(word) > 1 and word not in STOPWORDS:
+                    yield word
+                continue
+            for chunk in _CJK.split(word):
+                if len(chunk) > 1 and chunk not in STOPWORDS:
+                    yield chunk
+            for run in _CJK.findall(word):
+                if len(run) == 1:
+                    yield run
+                for i in range(len(run) - 1):
+                    yield run[i : i + 2]
+
+
+def _search_url(rel: Path, slug: str | None = None) -> str:
+    """
+    Site route of a markdown file, following Docusaurus' default layout.
+
+    A frontmatter `slug` replaces the file name; for docs an absolute slug
+    (`/installation`) replaces the whole path below `/docs`. Translations
+    under `i18n/<locale>/` are routed below `/<locale>`.
+    """
+    parts = rel.with_suffix("").parts
+    locale = None
+    if parts[0] == "i18n" and len(parts) >= 4:
+        if parts[2] == "docusaurus-plugin-content-docs":
+            locale, parts = parts[1], ("docs", *parts[4:])
+        elif parts[2] == "docusaurus-plugin-content-blog":
+            locale, parts = parts[1], ("blog", *parts[3:])
+
+    if slug and parts[0] == "blog":
+        parts = ("blog", slug)
+    elif slug and slug.startswith("/"):
+        parts = ("docs", slug)
+    elif slug:
+        parts = (*parts[:-1], slug)
+    elif parts[-1] in ("index", "content"):
+        parts = parts[:-1]
+    if locale:
+        parts = (locale, *parts)
+    path = "/".join(part.strip("/") for part in parts)
+    return quote("/" + path.rstrip("/"))
+
+
+def _index_document(path: Path, cached: dict[str, Any] | None) -> dict[str, Any]:
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if cached and cached["sha256"] == digest:
+        return cached
+    meta = read_frontmatter(path)
+    slug = meta.get("slug")
+    url = _search_url(path.relative_to(ROOT_DIR), str(slug) if slug is not None else None)
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    terms: dict[str, int] = {}
+    for term in iter_tokens(lines):
+        terms[term] = terms.get(term, 0) + 1
     return {
-        "dir_name": dir_name,
-        "path": str(content_file),
-        "created_files": created_files
+        "sha256": digest,
+        "url": url,
+        "title": str(meta.get("title") or path.stem),
+        "terms": terms,
+    }
+
+
+def shard_key(term: str) -> str:
+    """
+    Shard a term belongs to: its first two characters for ASCII terms,
+    otherwise one of `SEARCH_UNICODE_BUCKETS` buckets by first code point,
+    which keeps CJK bigrams from producing thousands of tiny shards.
+    """
+    prefix = term[:SEARCH_SHARD_PREFIX]
+    if prefix.isascii():
+        return prefix
+    return f"u{ord(term[0]) % SEARCH_UNICODE_BUCKETS:02d}"
+
+
+def build_search_index(
+    roots: Iterable[str] = SEARCH_ROOTS,
+    out_dir: Path | None = None,
+    workers: int | None = None,
+    json_output: bool = False,
+) -> dict[str, Any]:
+    """
+    Build a sharded inverted index for the site search.
+
+    Layout of `out_dir` (default `static/search-index`):
+
+    - `manifest.json`: the shard names, the unicode bucket count used by
+      `shard_key`, and the document table (`[url, title]` per doc id,
+      `null` for removed docs)
+    - `<shard>.json`: `{term: [doc_id, tf, doc_id, tf, ...]}` for every term
+      whose `shard_key` is `<shard>`
+
+    Per-file term counts are cached by content hash, doc ids are stable
+    across builds, and shards whose content did not change are not rewritten.
+    """
+    start = datetime.now()
+    out_dir = out_dir or ROOT_DIR / "static" / "search-index"
+    try:
+        cache = json.loads(SEARCH_CACHE.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
+    if cache.get("version") != SEARCH_INDEX_VERSION:
+        cache = {"version": SEARCH_INDEX_VERSION, "files": {}, "ids": {}}
+    files_cache: dict[str, Any] = cache["files"]
+    ids: dict[str, int] = cache["ids"]
+
+    paths = sorted(
+        path
+        for root in roots
+        for path in (ROOT_DIR / root).rglob("*")
+        if path.suffix in MARKDOWN_SUFFIXES and path.is_file()
+    )
+    keys = [str(path.relative_to(ROOT_DIR)) for path in paths]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        docs = list(pool.map(lambda p, k: _index_document(p, files_cache.get(k)), paths, keys))
+    reindexed = sum(1 for k, doc in zip(keys, docs) if files_cache.get(k) is not doc)
+
+    # stable doc ids: keep existing ones, append new files, leave holes for removed
+    ids = {k: ids[k] for k in keys if k in ids}
+    next_id = max(ids.values(), default=-1) + 1
+    for key in keys:
+        if key not in ids:
+            ids[key], next_id = next_id, next_id + 1
+
+    table: list[list[str] | None] = [None] * next_id
+    postings: dict[str, array] = {}
+    for key, doc in zip(keys, docs):
+        doc_id = ids[key]
+        table[doc_id] = [doc["url"], doc["title"]]
+        for term, tf in doc["terms"].items():
+            if (plist := postings.get(term)) is None:
+                plist = postings[term] = array("I")
+            plist.append(doc_id)
+            plist.append(tf)
+
+    shards: dict[str, dict[str, list[int]]] = {}
+    for term in sorted(postings):
+        shards.setdefault(shard_key(term), {})[term] = postings[term].tolist()
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = total_bytes = 0
+    for key, shard in shards.items():
+        name = f"{key}.json"
+        payload = json.dumps(shard, ensure_ascii=False, separators=(",", ":")).encode()
+        total_bytes += len(payload)
+        dest = out_dir / name
+        if not dest.exists() or dest.stat().st_size != len(payload) or dest.read_bytes() != payload:
+            dest.write_bytes(payload)
+            written += 1
+    keep = {f"{key}.json" for key in shards} | {"manifest.json"}
+    for stale in {p.name for p in out_dir.glob("*.json")} - keep:
+        (out_dir / stale).unlink()
+
+    manifest = {
+        "version": SEARCH_INDEX_VERSION,
+        "unicode_buckets": SEARCH_UNICODE_BUCKETS,
+        "shards": sorted(shards),
+        "docs": table,
+    }
+    payload = json.dumps(manifest, ensure_ascii=False, separators=(",", ":")).encode()
+    total_bytes += len(payload)
+    (out_dir / "manifest.json").write_bytes(payload)
+
+    SEARCH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    _write_json_atomic(
+        SEARCH_CACHE,
+        {"version": SEARCH_INDEX_VERSION, "files": dict(zip(keys, docs)), "ids": ids},
+    )
+
+    elapsed = (datetime.now() - start).total_seconds()
+    report = {
+        "files": len(keys),
+        "reindexed": reindexed,
+        "terms": len(postings),
+        "shards": len(shards),
+        "shards_written": written,
+        "index_bytes": total_bytes,
+        "largest_shard_bytes": max(
+            ((out_dir / f"{key}.json").stat().st_size for key in shards), default=0
+        ),
+        "elapsed_seconds": round(elapsed, 3),
     }
+    if json_output:
+        print(json.dumps({"success": True, "path": str(out_dir.relative_to(ROOT_DIR)), **report}))
+    else:
+        logger.info(
+            f"Indexed {report['files']} files ({report['reindexed']} re-tokenized): "
+            f"{report['terms']} terms in {report['shards']} shards "
+            f"({report['shards_written']} written), {report['index_bytes']} bytes "
+            f"in {report['elapsed_seconds']}s"
+        )
+    return report
+
+
+# ============ Watch mode ============
+
+WATCH_ROOTS = ("blog", "docs", "i18n")
+WATCH_SUFFIXES = MARKDOWN_SUFFIXES | {".yml"}
+WATCH_EVENTS = {"created", "modified", "deleted", "moved"}
+
+
+class WatchState:
+    """
+    Artifacts `watch` keeps in memory: the blog index with its slug/title
+    lookups, the tags.yml/authors.yml registries, and the frontmatter of
+    every doc under docs/ and i18n/. All access goes through `lock`.
+    """
+
+    def __init__(self, roots: Iterable[str] = WATCH_ROOTS):
+        self.lock = threading.Lock()
+        self.roots = [ROOT_DIR / root for root in roots]
+        self.blog = BlogIndex.load()
+        self.blog.refresh()
+        self.docs: dict[str, dict[str, Any]] = {
+            str(path.relative_to(ROOT_DIR)): read_frontmatter(path)
+            for root in self.roots
+            if root != BLOG_DIR
+            for path in root.rglob("*")
+            if path.suffix in MARKDOWN_SUFFIXES and path.is_file()
+        }
+        self.updates = 0
+
+    def apply(self, path: Path) -> str | None:
+        """
+        Fold a single changed (or deleted) file into the in-memory state.
+
+        Returns the path relative to `ROOT_DIR` if anything was updated.
+        """
+        if path.suffix not in WATCH_SUFFIXES or not path.is_relative_to(ROOT_DIR):
+            return None
+        key = str(path.relative_to(ROOT_DIR))
+        with self.lock:
+            if path.parent == BLOG_DIR and path.name in ("tags.yml", "authors.yml"):
+                self.blog.reload_registries()
+            elif path.suffix not in MARKDOWN_SUFFIXES:
+                return None
+            elif path.is_relative_to(BLOG_DIR):
+                if path.is_file():
+                    self.blog.update(path)
+                else:
+                    self.blog.remove(key)
+            elif path.is_file():
+                self.docs[key] = read_frontmatter(path)
+            else:
+                self.docs.pop(key, None)
+            self.updates += 1
+        return key
+
+    def validate(self, query: dict[str, list[str]]) -> dict[str, Any]:
+        def values(name: str) -> list[str]:
+            return [v for raw in query.get(name, []) for v in raw.split(",") if v]
+
+        title = query.get("title", [""])[0]
+        path = query.get("path", [None])[0]
+        with self.lock:
+            if path and (entry := self.blog.entries.get(path)):
+                title = title or entry["title"]
+                slug, authors, tags = entry["slug"], entry["authors"], entry["tags"]
+            else:
+                slug = to_kebab_case(title)
+                authors, tags = values("authors"), values("tags")
+            slug = query.get("slug", [slug])[0]
+            if not title:
+                return {"success": False, "slug": slug, "errors": ["Post is missing a title"]}
+            errors = self.blog.validate(slug, title, authors, tags, path=path)
+        return {"success": not errors, "slug": slug, "errors": errors}
+
+    def summary(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "success": True,
+                "posts": len(self.blog.entries),
+                "docs": len(self.docs),
+                "tags": sorted(self.blog.known_tags),
+                "authors": sorted(self.blog.known_authors),
+                "updates": self.updates,
+            }
+
+
+def _snapshot(roots: Iterable[Path]) -> dict[str, tuple[int, int]]:
+    snapshot: dict[str, tuple[int, int]] = {}
+    for root in roots:
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                if Path(name).suffix in WATCH_SUFFIXES:
+                    path = os.path.join(dirpath, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def _poll_changes(
+    roots: list[Path], interval: float, changes: "queue.Queue[Path]", stop: threading.Event
+) -> None:
+    """
+    Fallback watcher: diff stat snapshots every `interval` seconds.
+    """
+    previous = _snapshot(roots)
+    while not stop.wait(interval):
+        current = _snapshot(roots)
+        for path in current.keys() ^ previous.keys():
+            changes.put(Path(path))
+        for path in current.keys() & previous.keys():
+            if current[path] != previous[path]:
+                changes.put(Path(path))
+        previous = current
+
+
+def _start_observer(roots: list[Path], changes: "queue.Queue[Path]") -> Any:
+    """
+    Watch `roots` with OS file events (inotify on Linux) via `watchdog`.
+
+    Returns None when watchdog is not installed.
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    class Handler(FileSystemEventHandler):
+        def on_any_event(self, event: Any) -> None:
+            # reading a file raises opened/closed events too, reacting to those loops forever
+            if event.is_directory or event.event_type not in WATCH_EVENTS:
+                return
+            changes.put(Path(event.src_path))
+            if dest := getattr(event, "dest_path", None):
+                changes.put(Path(dest))
+
+    observer = Observer()
+    for root in roots:
+        if root.exists():
+            observer.schedule(Handler(), str(root), recursive=True)
+    observer.start()
+    return observer
+
+
+def _watch_handler(state: WatchState) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            url = urlsplit(self.path)
+            if url.path == "/validate":
+                self._reply(200, state.validate(parse_qs(url.query)))
+            elif url.path == "/status":
+                self._reply(200, state.summary())
+            elif url.path == "/posts":
+                with state.lock:
+                    posts = list(state.blog.entries.values())
+                self._reply(200, {"success": True, "posts": posts})
+            else:
+                self._reply(404, {"success": False, "message": f"Unknown path {url.path}"})
+
+        def _reply(self, status: int, data: dict[str, Any]) -> None:
+            body = json.dumps(data).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+def watch(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    interval: float = 1.0,
+    poll: bool = False,
+) -> None:
+    """
+    Keep blog/docs metadata hot and answer validation queries over HTTP.
+
+    Endpoints (all GET, JSON):
+
+    - `/validate?title=..&tags=a,b&authors=..` checks a new post;
+      `/validate?path=blog/.../content.md` re-checks an existing one
+    - `/status`: counts plus the known tags and authors
+    - `/posts`: every indexed blog entry
+    """
+    state = WatchState()
+    changes: queue.Queue[Path] = queue.Queue()
+    stop = threading.Event()
+
+    observer = None if poll else _start_observer(state.roots, changes)
+    if observer is None:
+        threading.Thread(
+            target=_poll_changes, args=(state.roots, interval, changes, stop), daemon=True
+        ).start()
+
+    server = ThreadingHTTPServer((host, port), _watch_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    logger.info(
+        f"Watching {', '.join(WATCH_ROOTS)} ({'events' if observer else 'polling'}), "
+        f"{len(state.blog.entries)} posts and {len(state.docs)} docs loaded, "
+        f"serving on http://{host}:{port}"
+    )
+
+    try:
+        while True:
+            if key := state.apply(changes.get()):
+                logger.info(f"Updated {key}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.shutdown()
+        if observer is not None:
+            observer.stop()
+            observer.join()
+        with state.lock:
+            state.blog.save()
+
+
+# ============ Frontmatter rewrite ============
+
+_FLOW_UNSAFE = re.compile(r"[,\[\]{}:#&*!|>'\"%@`]|^\s|\s$")
+
+
+def _render_list(values: list[Any]) -> str:
+    items = [json.dumps(v, ensure_ascii=False) if _FLOW_UNSAFE.search(str(v)) else str(v) for v in values]
+    return f"[{', '.join(items)}]"
+
+
+def _frontmatter_segments(lines: list[str]) -> list[tuple[str | None, list[str]]]:
+    """
+    Group raw frontmatter lines into `(key, lines)` segments, one per
+    top-level key together with its indented/list continuation lines.
+    """
+    segments: list[tuple[str | None, list[str]]] = []
+    for line in lines:
+        if (m := _TOP_LEVEL_KEY.match(line)) and not line[:1].isspace():
+            segments.append((m.group(1).strip(), [line]))
+        elif segments:
+            segments[-1][1].append(line)
+        else:
+            segments.append((None, [line]))
+    return segments
+
+
+def _segment_value(segment: list[str]) -> Any:
+    _, _, value = segment[0].partition(":")
+    if _strip_comment(value).strip():
+        return _parse_scalar(value)
+    return [_parse_scalar(m.group(1)) for line in segment[1:] if (m := _LIST_ITEM.match(line))]
+
+
+def _rename(values: list[Any], renames: dict[str, str], removed: set[str]) -> list[Any]:
+    result: list[Any] = []
+    for value in values:
+        value = renames.get(str(value), value)
+        if str(value) not in removed and value not in result:
+            result.append(value)
+    return result
+
+
+def transform_frontmatter(lines: list[str], spec: dict[str, Any]) -> list[str]:
+    """
+    Apply a rewrite `spec` to raw frontmatter lines.
+
+    Only the segments a transform actually changes are re-rendered, every
+    other line is returned byte for byte. `spec` keys: `rename_tags`,
+    `remove_tags`, `rename_authors`, `set_authors`, `toc_min`, `toc_max`.
+    """
+    segments = _frontmatter_segments(lines)
+    values = {key: _segment_value(seg) for key, seg in segments if key}
+    updates: dict[str, str] = {}
+
+    if "tags" in values and (spec.get("rename_tags") or spec.get("remove_tags")):
+        old = _as_list(values["tags"])
+        new = _rename(old, spec.get("rename_tags", {}), set(spec.get("remove_tags", [])))
+        if new != old:
+            updates["tags"] = _render_list(new)
+
+    if "authors" in values and (spec.get("rename_authors") or spec.get("set_authors")):
+        old = _as_list(values["authors"])
+        new = spec.get("set_authors") or _rename(old, spec["rename_authors"], set())
+        if new != old:
+            updates["authors"] = _render_list(new)
+
+    for key, level in (
+        ("toc_min_heading_level", spec.get("toc_min")),
+        ("toc_max_heading_level", spec.get("toc_max")),
+    ):
+        if level is not None and values.get(key) != level:
+            updates[key] = str(level)
+
+    if not updates:
+        return lines
+    result: list[str] = []
+    for key, seg in segments:
+        if key in updates:
+            result.append(f"{key}: {updates.pop(key)}\n")
+        else:
+            result.extend(seg)
+    result.extend(f"{key}: {value}\n" for key, value in updates.items())  # keys not present yet
+    return result
+
+
+def _read_frontmatter_lines(f: Any) -> list[str] | None:
+    """
+    Raw frontmatter lines of a binary file object, leaving it at the body.
+    """
+    if f.readline().strip() != FRONTMATTER_DELIMITER.encode():
+        return None
+    lines: list[str] = []
+    while line := f.readline():
+        if line.strip() == FRONTMATTER_DELIMITER.encode():
+            return lines
+        lines.append(line.decode("utf-8"))
+    return None  # unterminated block, leave the file alone
+
+
+def _rewrite_post(path: Path, spec: dict[str, Any], dry_run: bool) -> dict[str, Any] | None:
+    with path.open("rb") as f:
+        if (old := _read_frontmatter_lines(f)) is None:
+            return None
+        new = transform_frontmatter(old, spec)
+        if new == old:
+            return None
+        rel = str(path.relative_to(ROOT_DIR))
+        if dry_run:
+            # keep the delimiters so hunk line numbers match the file
+            delimiter = [f"{FRONTMATTER_DELIMITER}\n"]
+            diff = difflib.unified_diff(
+                delimiter + old + delimiter, delimiter + new + delimiter, f"a/{rel}", f"b/{rel}"
+            )
+            return {"path": rel, "diff": "".join(diff)}
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                out.write(f"{FRONTMATTER_DELIMITER}\n{''.join(new)}{FRONTMATTER_DELIMITER}\n".encode())
+                shutil.copyfileobj(f, out)  # body is streamed, never held in memory
+            shutil.copymode(path, tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    return {"path": rel}
+
+
+def _rewrite_chunk(chunk: list[tuple[str, dict[str, Any], bool]]) -> list[dict[str, Any]]:
+    """
+    Worker entry point: rewrite each post in `chunk`, reporting only changes.
+    """
+    results: list[dict[str, Any]] = []
+    for path, spec, dry_run in chunk:
+        try:
+            if (result := _rewrite_post(Path(path), spec, dry_run)) is not None:
+                results.append({"success": True, **result})
+        except Exception as exc:
+            results.append({"success": False, "path": path, "message": str(exc)})
+    return results
+
+
+def rewrite_posts(
+    spec: dict[str, Any],
+    dry_run: bool = False,
+    workers: int | None = None,
+    chunk_size: int = 64,
+    json_output: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Apply a frontmatter transform to every post under `BLOG_DIR`.
+
+    Posts are streamed to a process pool; each worker reads only the
+    frontmatter, skips files the transform leaves unchanged, and writes
+    the rest through a temp file and `os.replace`. With `dry_run` the
+    frontmatter diffs are reported instead.
+    """
+    start = datetime.now()
+    for renamed in (spec.get("rename_tags") or {}).values():
+        if (known := read_yaml_keys(BLOG_DIR / "tags.yml")) and renamed not in known:
+            logger.warning(f"Tag '{renamed}' is not defined in blog/tags.yml")
+
+    posts = (
+        (str(path), spec, dry_run)
+        for path in BLOG_DIR.rglob("*")
+        if path.suffix in MARKDOWN_SUFFIXES and path.is_file()
+    )
+    results = list(_pool_map_chunks(_rewrite_chunk, posts, workers, chunk_size))
+    failed = [r for r in results if not r["success"]]
+
+    elapsed = (datetime.now() - start).total_seconds()
+    verb = "would change" if dry_run else "changed"
+    if json_output:
+        print(
+            json.dumps(
+                {
+                    "success": not failed,
+                    "dry_run": dry_run,
+                    "message": f"{len(results) - len(failed)} posts {verb}, {len(failed)} failed",
+                    "posts": results,
+                    "elapsed_seconds": round(elapsed, 3),
+                }
+            )
+        )
+    else:
+        for result in results:
+            if not result["success"]:
+                logger.error(f"{result['path']}: {result['message']}")
+            elif dry_run:
+                logger.info(result["diff"])
+        logger.info(f"{len(results) - len(failed)} posts {verb} in {elapsed:.3f}s")
+    return results
+
+
+def _key_value(raw: str) -> tuple[str, str]:
+    old, sep, new = raw.partition("=")
+    if not sep or not old or not new:
+        raise argparse.ArgumentTypeError(f"expected OLD=NEW, got '{raw}'")
+    return old, new
 
 
 def main():
@@ -175,21 +1977,328 @@ def main():
         action="store_true",
         help="Output result in JSON format",
     )
+    blog_parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip slug/title/tag/author checks against the blog index",
+    )
+
+    # Batch subcommand
+    batch_parser = subparsers.add_parser(
+        "blog-batch", help="Generate blog posts in bulk from a manifest"
+    )
+    batch_parser.add_argument(
+        "manifest", type=Path, help="JSONL or multi-document YAML manifest"
+    )
+    batch_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count)",
+    )
+    batch_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=64,
+        help="Manifest entries handed to a worker at once (default: 64)",
+    )
+    batch_parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip slug/title/tag/author checks against the blog index",
+    )
+
+    # Index subcommand
+    index_parser = subparsers.add_parser(
+        "index", help="Build or incrementally update the blog frontmatter index"
+    )
+    index_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output result in JSON format",
+    )
+
+    # Assets subcommand
+    assets_parser = subparsers.add_parser(
+        "assets", help="Dedupe, clean and optimize images under static/ and blog/"
+    )
+    assets_parser.add_argument(
+        "--no-dedupe",
+        action="store_true",
+        help="Do not replace identical images with hardlinks",
+    )
+    assets_parser.add_argument(
+        "--no-variants",
+        action="store_true",
+        help="Do not build recompressed/resized variants",
+    )
+    assets_parser.add_argument(
+        "--widths",
+        nargs="*",
+        type=int,
+        default=list(VARIANT_WIDTHS),
+        help="Variant widths in pixels (default: 480 960 1920)",
+    )
+    assets_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count)",
+    )
+    assets_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would change without touching any file",
+    )
+    assets_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output result in JSON format",
+    )
+
+    # Link checker subcommand
+    links_parser = subparsers.add_parser(
+        "check-links", help="Check relative links and images in blog/, docs/ and i18n/"
+    )
+    links_parser.add_argument(
+        "roots",
+        nargs="*",
+        default=list(MARKDOWN_ROOTS),
+        help="Directories to scan (default: blog docs i18n)",
+    )
+    links_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of scanner threads",
+    )
+    links_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output result in JSON format",
+    )
+
+    # Translation subcommands
+    i18n_status_parser = subparsers.add_parser(
+        "i18n-status", help="Report docs whose translation is missing or stale"
+    )
+    i18n_mark_parser = subparsers.add_parser(
+        "i18n-mark", help="Record docs as translated at their current content"
+    )
+    i18n_mark_parser.add_argument(
+        "docs",
+        nargs="*",
+        type=Path,
+        help="Source docs under docs/ (default: every translated doc)",
+    )
+    for sub in (i18n_status_parser, i18n_mark_parser):
+        sub.add_argument(
+            "--locale",
+            default="ja",
+            help="Translation locale under i18n/ (default: ja)",
+        )
+        sub.add_argument(
+            "--json",
+            action="store_true",
+            help="Output result in JSON format",
+        )
+
+    # Search index subcommand
+    search_parser = subparsers.add_parser(
+        "search-index", help="Build the sharded search index under static/search-index"
+    )
+    search_parser.add_argument(
+        "roots",
+        nargs="*",
+        default=list(SEARCH_ROOTS),
+        help="Directories to index (default: blog docs i18n)",
+    )
+    search_parser.add_argument(
+        "--out",
+        type=Path,
+        default=None,
+        help="Output directory (default: static/search-index)",
+    )
+    search_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of tokenizer threads",
+    )
+    search_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output result in JSON format",
+    )
+
+    # Watch subcommand
+    watch_parser = subparsers.add_parser(
+        "watch", help="Keep blog/docs metadata in memory and serve validation"
+    )
+    watch_parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address to serve on (default: 127.0.0.1)",
+    )
+    watch_parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="Port to serve on (default: 8765)",
+    )
+    watch_parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Poll for changes instead of using file system events",
+    )
+    watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="Polling interval in seconds (default: 1.0)",
+    )
+
+    # Rewrite subcommand
+    rewrite_parser = subparsers.add_parser(
+        "rewrite", help="Apply frontmatter changes to every blog post"
+    )
+    rewrite_parser.add_argument(
+        "--rename-tag",
+        action="append",
+        type=_key_value,
+        default=[],
+        metavar="OLD=NEW",
+        help="Rename a tag (repeatable)",
+    )
+    rewrite_parser.add_argument(
+        "--remove-tag",
+        action="append",
+        default=[],
+        metavar="TAG",
+        help="Remove a tag (repeatable)",
+    )
+    rewrite_parser.add_argument(
+        "--rename-author",
+        action="append",
+        type=_key_value,
+        default=[],
+        metavar="OLD=NEW",
+        help="Reassign posts from one author to another (repeatable)",
+    )
+    rewrite_parser.add_argument(
+        "--set-authors",
+        nargs="+",
+        default=None,
+        help="Replace the authors of every post",
+    )
+    rewrite_parser.add_argument(
+        "--toc_min_heading_level",
+        type=int,
+        default=None,
+        help="Set the TOC min heading level",
+    )
+    rewrite_parser.add_argument(
+        "--toc_max_heading_level",
+        type=int,
+        default=None,
+        help="Set the TOC max heading level",
+    )
+    rewrite_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show frontmatter diffs without writing anything",
+    )
+    rewrite_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count)",
+    )
+    rewrite_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output result in JSON format",
+    )
 
     args = parser.parse_args()
 
     if args.command == "blog":
-        generate_blog_post(
-            title=args.title,
-            authors=args.authors,
-            tags=args.tags,
-            date=args.date,
-            toc_min=args.toc_min_heading_level,
-            toc_max=args.toc_max_heading_level,
-            content_body=args.content,
-            images=args.images,
+        try:
+            generate_blog_post(
+                title=args.title,
+                authors=args.authors,
+                tags=args.tags,
+                date=args.date,
+                toc_min=args.toc_min_heading_level,
+                toc_max=args.toc_max_heading_level,
+                content_body=args.content,
+                images=args.images,
+                json_output=args.json,
+                validate=not args.no_validate,
+            )
+        except ValueError as exc:
+            if args.json:
+                print(json.dumps({"success": False, "message": str(exc)}))
+            else:
+                logger.error(f"Blog post not created: {exc}")
+            sys.exit(1)
+    elif args.command == "blog-batch":
+        summary = generate_blog_batch(
+            args.manifest,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            validate=not args.no_validate,
+        )
+        if not summary["success"]:
+            sys.exit(1)
+    elif args.command == "index":
+        build_index(json_output=args.json)
+    elif args.command == "assets":
+        process_assets(
+            dedupe=not args.no_dedupe,
+            variants=not args.no_variants,
+            widths=tuple(args.widths),
+            workers=args.workers,
+            dry_run=args.dry_run,
             json_output=args.json,
         )
+    elif args.command == "check-links":
+        if check_links(args.roots, workers=args.workers, json_output=args.json):
+            sys.exit(1)
+    elif args.command == "search-index":
+        build_search_index(
+            args.roots, out_dir=args.out, workers=args.workers, json_output=args.json
+        )
+    elif args.command == "watch":
+        watch(args.host, args.port, interval=args.interval, poll=args.poll)
+    elif args.command == "rewrite":
+        results = rewrite_posts(
+            {
+                "rename_tags": dict(args.rename_tag),
+                "remove_tags": args.remove_tag,
+                "rename_authors": dict(args.rename_author),
+                "set_authors": args.set_authors,
+                "toc_min": args.toc_min_heading_level,
+                "toc_max": args.toc_max_heading_level,
+            },
+            dry_run=args.dry_run,
+            workers=args.workers,
+            json_output=args.json,
+        )
+        if any(not r["success"] for r in results):
+            sys.exit(1)
+    elif args.command == "i18n-status":
+        if translation_status(args.locale, json_output=args.json):
+            sys.exit(1)
+    elif args.command == "i18n-mark":
+        try:
+            mark_translated(args.locale, args.docs or None, json_output=args.json)
+        except ValueError as exc:
+            if args.json:
+                print(json.dumps({"success": False, "message": str(exc)}))
+            else:
+                logger.error(f"Docs not marked: {exc}")
+            sys.exit(1)
     else:
         parser.print_help()
 